@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Shared setup for the AuditIQ RAG tool test scripts
+(test_echo_rag.py, test_audit_rag.py and test_both_rag_tools.py)
+"""
+
+import os
+import re
+import sys
+import logging
+import importlib
+from functools import lru_cache
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+# Checkout root holding the tool packages; override with AUDITIQ_ROOT
+PROJECT_ROOT = os.environ.get("AUDITIQ_ROOT", os.path.dirname(os.path.abspath(__file__)))
+ENV_FILE = os.path.join(PROJECT_ROOT, "audit_iq_audit_rag", ".env")
+
+# Progress output shared by the scripts; run with -q to only see problems and the final result
+log = logging.getLogger("auditiq_rag_tests")
+
+# Banner rules, built once
+BAR50 = "=" * 50
+DASH30 = "-" * 30
+# Shown in place of the Azure Search key
+KEY_MASK = "*" * 20
+
+# The .env file is parsed at most once per process
+_env_loaded = False
+# The only .env entries these tests use
+_ENV_KEYS = frozenset({"AzureSearchEndpoint", "AzureSearchAdminKey"})
+# Unquoted values end at a "#" that follows whitespace, as in python-dotenv
+_INLINE_COMMENT = re.compile(r"\s#")
+
+def configure_logging():
+    """Keep third-party loggers (e.g. the Azure SDK) at WARNING; only the test output is verbose."""
+    logging.basicConfig(format="%(message)s", level=logging.WARNING, stream=sys.stdout)
+    log.setLevel(logging.WARNING if "-q" in sys.argv else logging.INFO)
+
+def _add_to_path(src_dir):
+    """Put src_dir at the front of sys.path unless it is already there."""
+    if src_dir not in sys.path:
+        sys.path.insert(0, src_dir)
+
+def _parse_env_value(value):
+    """Strip quotes from a .env value, or a trailing inline comment from an unquoted one."""
+    value = value.strip()
+    if value[:1] in ("'", '"'):
+        end = value.find(value[0], 1)
+        return value[1:end] if end > 0 else value[1:]
+    return _INLINE_COMMENT.split(value, 1)[0].rstrip()
+
+def load_env(env_file=ENV_FILE):
+    """
+    Load the Azure Search settings from env_file once, skipping it entirely when
+    they are already set (e.g. in CI). Existing environment values win, as with
+    python-dotenv's default, and other keys in the file are ignored. Lines may
+    start with `export` and unquoted values may end in a `# comment`.
+    """
+    global _env_loaded
+    if _env_loaded or os.getenv("AzureSearchEndpoint"):
+        return
+    _env_loaded = True
+    try:
+        with open(env_file) as f:
+            for line in f:
+                line = line.strip()
+                if line.startswith("export "):
+                    line = line[len("export "):].lstrip()
+                if not line or line.startswith("#") or "=" not in line:
+                    continue
+                name, _, value = line.partition("=")
+                name = name.strip()
+                if name in _ENV_KEYS:
+                    os.environ.setdefault(name, _parse_env_value(value))
+    except OSError:
+        pass
+
+@lru_cache(maxsize=8)
+def get_tool(package, class_name, endpoint, key):
+    """
+    Import a RAG tool package and build its tool for these credentials, once the
+    credentials check has passed. The package is only added to the Python path
+    if it has not been imported already, and later runs in the same process
+    reuse the instance and its search client.
+    """
+    module = sys.modules.get(package)
+    if module is None:
+        _add_to_path(os.path.join(PROJECT_ROOT, package, "src"))
+        module = importlib.import_module(package)
+    return getattr(module, class_name)(endpoint=endpoint, key=key)
+
+def endpoint_reachable(endpoint, key, timeout=3):
+    """
+    Send one cheap HEAD request to the search endpoint. Any HTTP response, even
+    401/403/404, shows the service can be reached; only connection failures count.
+    """
+    request = urllib.request.Request(endpoint.rstrip("/") + "/", method="HEAD", headers={"api-key": key})
+    try:
+        urllib.request.urlopen(request, timeout=timeout).close()
+    except urllib.error.HTTPError:
+        pass
+    except (urllib.error.URLError, OSError) as e:
+        log.error(f"❌ Azure Search endpoint unreachable: {e}")
+        return False
+    return True
+
+def run_query_suite(label, package, class_name, test_queries):
+    """Search with one RAG tool for each query, reporting each in order; True if none failed."""
+
+    log.info(f"🔍 Testing AuditIQ {label} RAG Tool")
+    log.info(BAR50)
+
+    # Load environment variables
+    load_env()
+
+    # Check environment variables
+    endpoint = os.getenv("AzureSearchEndpoint")
+    key = os.getenv("AzureSearchAdminKey")
+
+    log.info(f"Azure Search Endpoint: {endpoint}")
+    log.info(f"Azure Search Key: {KEY_MASK if key else 'NOT SET'}")
+    log.info("")
+
+    if not endpoint or not key:
+        log.error("❌ Azure Search credentials not configured!")
+        log.error("Please check your .env file.")
+        return False
+
+    # Fail fast instead of letting every query time out when the service is down
+    if not endpoint_reachable(endpoint, key):
+        return False
+
+    try:
+        # Import and initialize the tool
+        tool = get_tool(package, class_name, endpoint, key)
+        statuses = sys.modules[package]
+
+        log.info(f"✅ {label} RAG tool imported successfully")
+        log.info("")
+
+        # The searches are independent round-trips, so issue them all at once
+        # and report each one in query order as soon as it is ready
+        with ThreadPoolExecutor(max_workers=len(test_queries)) as executor:
+            futures = [executor.submit(tool.run_with_status, query=query, top=2) for query in test_queries]
+
+            for i, (query, future) in enumerate(zip(test_queries, futures), 1):
+                # Each test is written as one record, at the level of its outcome
+                banner = f"📋 Test {i}: {query}\n{DASH30}\n"
+
+                try:
+                    status, result = future.result()
+
+                    if status in (statuses.STATUS_ERROR, statuses.STATUS_UNREACHABLE):
+                        log.error(f"{banner}❌ Error: {result}")
+                        return False
+                    elif status == statuses.STATUS_EMPTY:
+                        log.warning(f"{banner}⚠️  No results found for: {query}\n")
+                    else:
+                        # Print first 200 characters of result
+                        preview = result[:200] + "..." if len(result) > 200 else result
+                        log.info(f"{banner}✅ Search successful!\nPreview: {preview}\n")
+
+                except Exception as e:
+                    log.error(f"{banner}❌ Exception during search: {str(e)}")
+                    return False
+
+        print(f"🎉 All {label} RAG tests completed successfully!")
+        return True
+
+    except ImportError as e:
+        log.error(f"❌ Failed to import {label} RAG tool: {str(e)}")
+        return False
+    except Exception as e:
+        log.error(f"❌ Unexpected error: {str(e)}")
+        return False
@@ -1,3 +1,3 @@
-from .tool import AuditIqAuditRag
+from .tool import AuditIqAuditRag, STATUS_OK, STATUS_EMPTY, STATUS_ERROR, STATUS_UNREACHABLE
 
-__all__ = ["AuditIqAuditRag"]
\ No newline at end of file
+__all__ = ["AuditIqAuditRag", "STATUS_OK", "STATUS_EMPTY", "STATUS_ERROR", "STATUS_UNREACHABLE"]
\ No newline at end of file
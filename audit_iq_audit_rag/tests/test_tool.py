@@ -6,7 +6,8 @@ Tests for the AuditIQ AUDIT RAG tool.
 import os
 import unittest
 from unittest.mock import patch, MagicMock
-from audit_iq_audit_rag import AuditIqAuditRag
+from azure.core.exceptions import ServiceRequestError
+from audit_iq_audit_rag import AuditIqAuditRag, STATUS_OK, STATUS_EMPTY, STATUS_ERROR, STATUS_UNREACHABLE
 
 
 class TestAuditIqAuditRag(unittest.TestCase):
@@ -35,6 +36,17 @@ class TestAuditIqAuditRag(unittest.TestCase):
         result = self.tool._run("test query")
         self.assertIn("Azure Search credentials not configured", result)
     
+    @patch.dict(os.environ, {}, clear=True)
+    @patch('audit_iq_audit_rag.tool.SearchClient')
+    def test_explicit_credentials(self, mock_search_client):
+        """Test that credentials passed to the constructor are used without the environment."""
+        mock_search_client.return_value.search.return_value = []
+        tool = AuditIqAuditRag(endpoint="https://explicit.search.windows.net", key="explicit_key")
+        
+        tool._run("test query")
+        
+        self.assertEqual(mock_search_client.call_args.kwargs["endpoint"], "https://explicit.search.windows.net")
+    
     @patch.dict(os.environ, {"AzureSearchEndpoint": "https://test.search.windows.net", "AzureSearchAdminKey": "test_key"})
     @patch('audit_iq_audit_rag.tool.SearchClient')
     def test_successful_search(self, mock_search_client):
@@ -69,6 +81,46 @@ class TestAuditIqAuditRag(unittest.TestCase):
         
         self.assertIn("No results found in audit methodology index (audit-iq)", result)
     
+    @patch.dict(os.environ, {"AzureSearchEndpoint": "https://test.search.windows.net", "AzureSearchAdminKey": "test_key"})
+    @patch('audit_iq_audit_rag.tool.SearchClient')
+    def test_run_with_status(self, mock_search_client):
+        """Test that each outcome is reported with its status."""
+        mock_client_instance = mock_search_client.return_value
+        
+        mock_client_instance.search.return_value = [{"title": "T", "content": "C", "@search.score": 1.0}]
+        self.assertEqual(self.tool.run_with_status("q")[0], STATUS_OK)
+        
+        mock_client_instance.search.return_value = []
+        self.assertEqual(self.tool.run_with_status("q")[0], STATUS_EMPTY)
+        
+        mock_client_instance.search.side_effect = Exception("Search failed")
+        status, result = self.tool.run_with_status("q")
+        self.assertEqual(status, STATUS_ERROR)
+        self.assertEqual(result, self.tool._run("q"))
+    
+    @patch.dict(os.environ, {"AzureSearchEndpoint": "https://test.search.windows.net", "AzureSearchAdminKey": "test_key"})
+    @patch('audit_iq_audit_rag.tool.SearchClient')
+    def test_service_unreachable(self, mock_search_client):
+        """Test that connection failures are reported as unreachable."""
+        mock_search_client.return_value.search.side_effect = ServiceRequestError("Name or service not known")
+        
+        status, result = self.tool.run_with_status("test query")
+        
+        self.assertEqual(status, STATUS_UNREACHABLE)
+        self.assertIn("Name or service not known", result)
+    
+    @patch.dict(os.environ, {"AzureSearchEndpoint": "https://test.search.windows.net", "AzureSearchAdminKey": "test_key"})
+    @patch('audit_iq_audit_rag.tool.SearchClient')
+    def test_search_client_reused(self, mock_search_client):
+        """Test that the search client is created once and reused across queries."""
+        mock_search_client.return_value.search.return_value = []
+        
+        self.tool._run("first query")
+        self.tool._run("second query")
+        
+        mock_search_client.assert_called_once()
+        self.assertEqual(mock_search_client.return_value.search.call_count, 2)
+    
     @patch.dict(os.environ, {"AzureSearchEndpoint": "https://test.search.windows.net", "AzureSearchAdminKey": "test_key"})
     @patch('audit_iq_audit_rag.tool.SearchClient')
     def test_client_initialization_error(self, mock_search_client):
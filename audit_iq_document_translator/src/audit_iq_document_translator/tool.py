@@ -1,6 +1,6 @@
 from crewai.tools import BaseTool
 from typing import Type, Optional, List, Tuple
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 import os
 import platform
 import tempfile
@@ -374,9 +374,9 @@ class AzureBlobStorageHelper:
             with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as temp_file:
                 temp_path = temp_file.name
                 
-                # Download blob content
+                # Stream blob content straight into the temp file in chunks
                 download_stream = blob_client.download_blob()
-                temp_file.write(download_stream.readall())
+                download_stream.readinto(temp_file)
             
             return temp_path, original_filename
             
@@ -544,6 +544,8 @@ class AuditIqDocumentTranslator(BaseTool):
         "images, tables, and layout. Outputs to same storage type as input unless specified otherwise."
     )
     args_schema: Type[BaseModel] = DocumentTranslationInput
+    _endpoint: Optional[str] = PrivateAttr(default=None)
+    _key: Optional[str] = PrivateAttr(default=None)
 
     def __init__(self):
         super().__init__()
@@ -753,9 +755,12 @@ class AuditIqDocumentTranslator(BaseTool):
     def _perform_azure_translation(self, file_path: str, target_language: str, source_language: str, output_file_path: str) -> str:
         """Perform the actual Azure translation."""
         try:
-            # Get Azure Document Translation configuration from environment
-            endpoint = os.getenv("AZURE_DOCUMENT_TRANSLATION_ENDPOINT")
-            key = os.getenv("AZURE_DOCUMENT_TRANSLATION_KEY")
+            # Get Azure Document Translation configuration from environment (cached after first read)
+            if not (self._endpoint and self._key):
+                self._endpoint = os.getenv("AZURE_DOCUMENT_TRANSLATION_ENDPOINT")
+                self._key = os.getenv("AZURE_DOCUMENT_TRANSLATION_KEY")
+            endpoint = self._endpoint
+            key = self._key
             
             if not endpoint or not key:
                 return "Error: Azure Document Translation credentials not configured. Please check AZURE_DOCUMENT_TRANSLATION_ENDPOINT and AZURE_DOCUMENT_TRANSLATION_KEY in environment variables."
@@ -763,33 +768,33 @@ class AuditIqDocumentTranslator(BaseTool):
             # Initialize the translation client
             client = SingleDocumentTranslationClient(endpoint, AzureKeyCredential(key))
             
-            # Read the document file
-            with open(file_path, 'rb') as file:
-                file_contents = file.read()
-                file_name = os.path.basename(file_path)
+            file_name = os.path.basename(file_path)
             
             # Get the appropriate content type for the file
             content_type = self._get_content_type(file_path)
             
-            # Create document translate content
-            # Let Azure auto-detect content type by only providing filename and content
-            document_translate_content = DocumentTranslateContent(
-                document=(file_name, file_contents)
-            )
-            
-            # Perform translation using Azure Document Translation API
-            # The correct format requires target_language as keyword-only argument
-            if source_language != "auto":
-                response = client.translate(
-                    document_translate_content,
-                    target_language=target_language,
-                    source_language=source_language
-                )
-            else:
-                response = client.translate(
-                    document_translate_content,
-                    target_language=target_language
+            # Pass the open file to the SDK so the upload streams from disk
+            # instead of holding the whole document in memory first
+            with open(file_path, 'rb') as file:
+                # Create document translate content
+                # Let Azure auto-detect content type by only providing filename and content
+                document_translate_content = DocumentTranslateContent(
+                    document=(file_name, file)
                 )
+                
+                # Perform translation using Azure Document Translation API
+                # The correct format requires target_language as keyword-only argument
+                if source_language != "auto":
+                    response = client.translate(
+                        document_translate_content,
+                        target_language=target_language,
+                        source_language=source_language
+                    )
+                else:
+                    response = client.translate(
+                        document_translate_content,
+                        target_language=target_language
+                    )
             
             # Save translated document
             with open(output_file_path, 'wb') as output_file:
@@ -4,12 +4,17 @@ Simple script to translate local documents and upload to blob storage.
 """
 
 import os
+import re
 import sys
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+# Matches the output path in the tool's success message
+_OUT_RE = re.compile(r'output saved to:\s*(\S+)', re.IGNORECASE)
+
 def load_env():
     """Load environment variables."""
     env_file = Path(__file__).parent / ".env"
@@ -25,6 +30,46 @@ def load_env():
                         key, value = line.split('=', 1)
                         os.environ[key.strip()] = value.strip()
 
+def translate_and_upload(tool, file_path, target_lang):
+    """Translate one file to one language and upload the result, returning report lines."""
+    report = [f"   🔄 Translating to {target_lang}..."]
+    
+    try:
+        result = tool._run(
+            file_path=str(file_path),
+            target_language=target_lang
+        )
+        
+        if "successfully translated" in result.lower():
+            report.append(f"   ✅ Translation to {target_lang} completed")
+            
+            # Extract output file and upload to blob storage
+            match = _OUT_RE.search(result)
+            if match:
+                output_file = match.group(1)
+                if os.path.exists(output_file):
+                    try:
+                        # Upload to blob storage
+                        blob_filename = os.path.basename(output_file)
+                        blob_path = f"translated/{blob_filename}"
+                        
+                        blob_url = tool.blob_helper.upload_file_to_blob(
+                            output_file, blob_path, overwrite=True
+                        )
+                        report.append(f"   📤 Uploaded to: {blob_path}")
+                        
+                    except Exception as e:
+                        report.append(f"   ⚠️  Upload failed: {e}")
+        else:
+            report.append(f"   ❌ Translation to {target_lang} failed")
+            if "format parameter" in result:
+                report.append("      (PDF format issue - known limitation)")
+    
+    except Exception as e:
+        report.append(f"   ❌ Error: {e}")
+    
+    return report
+
 def main():
     """Translate documents and upload to blob storage."""
     print("🚀 Document Translation & Upload")
@@ -65,47 +110,24 @@ def main():
     
     print(f"📁 Found {len(files)} files to translate")
     
-    # Process each file
-    for file_path in files:
-        print(f"\n📄 Processing: {file_path.name}")
-        
-        for target_lang in target_languages:
-            print(f"   🔄 Translating to {target_lang}...")
-            
-            try:
-                result = tool._run(
-                    file_path=str(file_path),
-                    target_language=target_lang
-                )
-                
-                if "successfully translated" in result.lower():
-                    print(f"   ✅ Translation to {target_lang} completed")
-                    
-                    # Extract output file and upload to blob storage
-                    for line in result.split('\n'):
-                        if "output saved to:" in line.lower():
-                            output_file = line.split(":")[-1].strip().split()[0]
-                            if os.path.exists(output_file):
-                                try:
-                                    # Upload to blob storage
-                                    blob_filename = os.path.basename(output_file)
-                                    blob_path = f"translated/{blob_filename}"
-                                    
-                                    blob_url = tool.blob_helper.upload_file_to_blob(
-                                        output_file, blob_path, overwrite=True
-                                    )
-                                    print(f"   📤 Uploaded to: {blob_path}")
-                                    
-                                except Exception as e:
-                                    print(f"   ⚠️  Upload failed: {e}")
-                            break
-                else:
-                    print(f"   ❌ Translation to {target_lang} failed")
-                    if "format parameter" in result:
-                        print("      (PDF format issue - known limitation)")
-            
-            except Exception as e:
-                print(f"   ❌ Error: {e}")
+    # Translate every (file, language) pair concurrently, reporting each in order as soon
+    # as it and the jobs before it are done.
+    # Keep concurrency below the Translator service's request limit.
+    try:
+        max_workers = max(1, int(os.getenv("TRANSLATION_MAX_CONCURRENCY", "16")))
+    except ValueError:
+        print("⚠️ TRANSLATION_MAX_CONCURRENCY is not a number, using 16")
+        max_workers = 16
+    jobs = [(file_path, target_lang) for file_path in files for target_lang in target_languages]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        reports = executor.map(lambda job: translate_and_upload(tool, *job), jobs)
+        current_file = None
+        for (file_path, _), report in zip(jobs, reports):
+            if file_path != current_file:
+                current_file = file_path
+                print(f"\n📄 Processing: {file_path.name}")
+            for line in report:
+                print(line)
     
     print(f"\n🎉 Processing completed!")
     print("Check your blob storage 'translated' container for results")
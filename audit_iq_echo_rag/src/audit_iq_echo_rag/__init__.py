@@ -1,3 +1,3 @@
-from .tool import AuditIqEchoRag
+from .tool import AuditIqEchoRag, STATUS_OK, STATUS_EMPTY, STATUS_ERROR, STATUS_UNREACHABLE
 
-__all__ = ["AuditIqEchoRag"]
\ No newline at end of file
+__all__ = ["AuditIqEchoRag", "STATUS_OK", "STATUS_EMPTY", "STATUS_ERROR", "STATUS_UNREACHABLE"]
\ No newline at end of file
@@ -1,10 +1,18 @@
 from crewai.tools import BaseTool
-from typing import Type
-from pydantic import BaseModel, Field
+from typing import Optional, Tuple, Type
+from pydantic import BaseModel, Field, PrivateAttr
 import os
 import time
 from azure.search.documents import SearchClient
 from azure.core.credentials import AzureKeyCredential
+from azure.core.exceptions import ServiceRequestError
+
+# Outcome of a search, returned alongside the formatted text by run_with_status
+STATUS_OK = "ok"
+STATUS_EMPTY = "empty"
+STATUS_ERROR = "error"
+# The service could not be reached at all (DNS, connection refused, ...)
+STATUS_UNREACHABLE = "unreachable"
 
 
 class EchoSearchInput(BaseModel):
@@ -21,36 +29,60 @@ class AuditIqEchoRag(BaseTool):
         "and GT-specific requirements. Use this tool to find relevant GT internal documentation."
     )
     args_schema: Type[BaseModel] = EchoSearchInput
+    _endpoint: Optional[str] = PrivateAttr(default=None)
+    _key: Optional[str] = PrivateAttr(default=None)
+    _search_client: Optional[SearchClient] = PrivateAttr(default=None)
+
+    def __init__(self, endpoint: Optional[str] = None, key: Optional[str] = None, **kwargs):
+        """Optionally take the Azure Search endpoint and key instead of reading the environment."""
+        super().__init__(**kwargs)
+        self._endpoint = endpoint
+        self._key = key
 
     def _run(self, query: str, top: int = 5) -> str:
+        return self.run_with_status(query, top)[1]
+
+    def run_with_status(self, query: str, top: int = 5) -> Tuple[str, str]:
+        """
+        Run a search and return (status, text), where status is STATUS_OK, STATUS_EMPTY,
+        STATUS_ERROR or STATUS_UNREACHABLE, so callers need not scan the text to tell
+        the outcomes apart.
+        """
         try:
-            # Get Azure Search configuration from environment
-            search_endpoint = os.getenv("AzureSearchEndpoint")
-            search_key = os.getenv("AzureSearchAdminKey")
+            # Get Azure Search configuration from environment (cached after first read)
+            if not (self._endpoint and self._key):
+                self._endpoint = os.getenv("AzureSearchEndpoint")
+                self._key = os.getenv("AzureSearchAdminKey")
+            search_endpoint = self._endpoint
+            search_key = self._key
             
             if not search_endpoint or not search_key:
-                return "Error: Azure Search credentials not configured. Please check AzureSearchEndpoint and AzureSearchAdminKey in environment variables."
+                return STATUS_ERROR, "Error: Azure Search credentials not configured. Please check AzureSearchEndpoint and AzureSearchAdminKey in environment variables."
             
             # Use echo index for GT Guidelines and Policy (hardcoded)
             index_name = "echo"
             
-            # Initialize search client
-            try:
-                credential = AzureKeyCredential(search_key)
-                search_client = SearchClient(
-                    endpoint=search_endpoint,
-                    index_name=index_name,
-                    credential=credential
-                )
-            except Exception as init_error:
-                return f"Error initializing Azure Search client: {str(init_error)}. Please check your Azure Search credentials and endpoint configuration."
+            # Initialize search client once; later calls reuse it and its open connections
+            if self._search_client is None:
+                try:
+                    credential = AzureKeyCredential(search_key)
+                    self._search_client = SearchClient(
+                        endpoint=search_endpoint,
+                        index_name=index_name,
+                        credential=credential
+                    )
+                except Exception as init_error:
+                    return STATUS_ERROR, f"Error initializing Azure Search client: {str(init_error)}. Please check your Azure Search credentials and endpoint configuration."
+            search_client = self._search_client
             
             # Perform search with timeout (30 seconds)
             start_time = time.time()
             try:
+                # Only fetch the fields the formatter below uses
                 results = search_client.search(
                     search_text=query,
                     top=top,
+                    select=["title", "content"],
                     include_total_count=True
                 )
                 
@@ -58,12 +90,12 @@ class AuditIqEchoRag(BaseTool):
                 elapsed_time = time.time() - start_time
                 
                 if elapsed_time > 30:
-                    return f"Search timeout after {elapsed_time:.1f} seconds. Please try a simpler query."
+                    return STATUS_ERROR, f"Search timeout after {elapsed_time:.1f} seconds. Please try a simpler query."
                     
             except Exception as search_error:
                 elapsed_time = time.time() - start_time
                 if elapsed_time > 30:
-                    return f"Search timeout after {elapsed_time:.1f} seconds: {str(search_error)}"
+                    return STATUS_ERROR, f"Search timeout after {elapsed_time:.1f} seconds: {str(search_error)}"
                 raise search_error
             
             # Format results
@@ -78,9 +110,11 @@ class AuditIqEchoRag(BaseTool):
             
             if formatted_results:
                 header = f"Searched GT Guidelines and Policy index ({index_name}) and found {len(formatted_results)} results for query '{query}':\n\n"
-                return header + "\n---\n".join(formatted_results)
+                return STATUS_OK, header + "\n---\n".join(formatted_results)
             else:
-                return f"No results found in GT Guidelines and Policy index ({index_name}) for query: '{query}'"
+                return STATUS_EMPTY, f"No results found in GT Guidelines and Policy index ({index_name}) for query: '{query}'"
                 
+        except ServiceRequestError as e:
+            return STATUS_UNREACHABLE, f"Error searching GT Guidelines and Policy index: {str(e)}"
         except Exception as e:
-            return f"Error searching GT Guidelines and Policy index: {str(e)}"
\ No newline at end of file
+            return STATUS_ERROR, f"Error searching GT Guidelines and Policy index: {str(e)}"
\ No newline at end of file
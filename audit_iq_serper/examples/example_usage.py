@@ -6,7 +6,6 @@ This demonstrates how to use the tool both standalone and within a CrewAI agent.
 
 import os
 from dotenv import load_dotenv
-from audit_iq_serper import AuditIqSerper
 
 # Load environment variables
 load_dotenv()
@@ -15,6 +14,9 @@ def standalone_example():
     """Example of using the SERPER tool standalone."""
     print("=== Standalone Usage Example ===")
     
+    # Imported here so the API key check below fails fast without loading CrewAI
+    from audit_iq_serper import AuditIqSerper
+    
     # Initialize the tool
     serper_tool = AuditIqSerper()
     
@@ -34,6 +36,7 @@ def crewai_agent_example():
     """Example of using the SERPER tool within a CrewAI agent."""
     try:
         from crewai import Agent, Task, Crew
+        from audit_iq_serper import AuditIqSerper
         
         print("=== CrewAI Agent Usage Example ===")
         
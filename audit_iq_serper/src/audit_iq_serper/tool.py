@@ -1,8 +1,211 @@
 from crewai.tools import BaseTool
-from typing import Type
-from pydantic import BaseModel, Field
+from typing import Any, List, Optional, Type
+from pydantic import BaseModel, Field, PrivateAttr
 import os
-import requests
+import time
+import asyncio
+import queue
+import hashlib
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+import httpx
+from httpx import TimeoutException, ConnectError, HTTPStatusError, HTTPError
+import orjson
+
+
+# Shared HTTP/2 client so concurrent searches multiplex over one warm connection
+_CLIENT = None
+_CLIENT_LOCK = threading.Lock()
+
+# Async client and concurrency cap, one pair per event loop. A client whose loop has
+# closed is shut down when a new loop asks for one.
+_ASYNC_CLIENTS: dict = {}
+_ASYNC_CLIENTS_LOCK = threading.Lock()
+_ASYNC_MAX_CONCURRENCY = 64
+# Pending close tasks, referenced so they aren't garbage collected mid-close
+_CLOSING_CLIENTS: set = set()
+
+SERPER_URL = "https://google.serper.dev/search"
+
+# Keep idle connections open for 5 minutes (httpx default is 5s) so sporadic agent
+# searches reuse a warm connection instead of re-resolving DNS and re-handshaking
+_KEEPALIVE_EXPIRY = 300.0
+
+# Retry policy for throttled or failing SERPER responses
+_RETRY_STATUSES = {429, 500, 502, 503, 504}
+_MAX_RETRIES = 3
+
+
+async def _aclose_quietly(client: httpx.AsyncClient) -> None:
+    """Close a client left over from an ended event loop; its sockets may already be gone."""
+    try:
+        await client.aclose()
+    except Exception:
+        pass
+
+
+class _TokenBucket:
+    """Client-side token bucket that paces SERPER calls under the account quota."""
+
+    def __init__(self, rate: float, max_tokens: float):
+        self.rate = rate
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _take(self) -> bool:
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.max_tokens, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+    def acquire(self) -> None:
+        while not self._take():
+            time.sleep(0.1)
+
+    async def acquire_async(self) -> None:
+        while not self._take():
+            await asyncio.sleep(0.1)
+
+
+_DEFAULT_QPS = 5.0
+# Slowest pace allowed; zero or negative rates would never refill the bucket
+_MIN_QPS = 0.1
+
+
+def _qps_from_env() -> float:
+    """Read SERPER_QPS, falling back to the default when unset or not a number."""
+    try:
+        qps = float(os.getenv("SERPER_QPS", _DEFAULT_QPS))
+    except ValueError:
+        return _DEFAULT_QPS
+    return max(_MIN_QPS, qps)
+
+
+_BUCKET = _TokenBucket(rate=_qps_from_env(), max_tokens=10)
+
+
+def _retry_delay(response, attempt: int) -> float:
+    """Seconds to wait before retrying, honoring Retry-After when the server sends it."""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return min(30, max(0.0, float(retry_after)))
+        except ValueError:
+            pass
+    return min(30, 0.3 * 2 ** attempt)
+
+# In-process result cache: key -> (stored_at, formatted_result)
+_CACHE: dict[str, tuple[float, str]] = {}
+_CACHE_LOCK = threading.RLock()
+_CACHE_MAX_ENTRIES = 1024
+_CACHE_TTL = float(os.getenv("SERPER_CACHE_TTL", "600"))
+
+
+def _cache_key(query: str, num_results: int) -> str:
+    """Build a compact cache key for a normalized query and result count."""
+    raw = f"{query.lower().strip()}|{num_results}".encode()
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def _cache_get(key: str):
+    """Return a cached result if it is still fresh, refreshing its LRU position."""
+    with _CACHE_LOCK:
+        entry = _CACHE.pop(key, None)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= _CACHE_TTL:
+            return None
+        _CACHE[key] = entry
+        return entry[1]
+
+
+def _cache_put(key: str, value: str) -> None:
+    """Store a result, evicting the oldest 10% of entries when the cache is full."""
+    with _CACHE_LOCK:
+        _CACHE[key] = (time.monotonic(), value)
+        if len(_CACHE) > _CACHE_MAX_ENTRIES:
+            for old_key in list(_CACHE)[:max(1, _CACHE_MAX_ENTRIES // 10)]:
+                del _CACHE[old_key]
+
+
+def clear_cache() -> None:
+    """Drop all cached search results."""
+    with _CACHE_LOCK:
+        _CACHE.clear()
+
+
+# Result for a query a batch response left out
+_MISSING_RESULT = "Error with web search: SERPER returned no result for this query."
+
+
+class _Coalescer:
+    """Collects concurrent searches for a short window and sends them as one batch request."""
+
+    def __init__(self, run_many, window: float = 0.05, max_batch: int = 10):
+        self.run_many = run_many
+        self.window = window
+        self.max_batch = max_batch
+        self.pending = queue.Queue()
+        worker = threading.Thread(target=self._drain, name="serper-coalescer", daemon=True)
+        worker.start()
+
+    def submit(self, query: str, num_results: int) -> Future:
+        future = Future()
+        self.pending.put((query, num_results, future))
+        return future
+
+    def _drain(self) -> None:
+        while True:
+            batch = [self.pending.get()]
+            deadline = time.monotonic() + self.window
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self.pending.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            # One request per result size, since _run_many takes a single num_results
+            groups = {}
+            for query, num_results, future in batch:
+                groups.setdefault(num_results, []).append((query, future))
+            for num_results, items in groups.items():
+                try:
+                    results = self.run_many([query for query, _ in items], num_results)
+                except Exception as e:
+                    results = [f"Error with web search: {str(e)}"] * len(items)
+                # Never leave a caller waiting on a slot the batch didn't answer
+                results = list(results) + [_MISSING_RESULT] * (len(items) - len(results))
+                for (_, future), result in zip(items, results):
+                    future.set_result(result)
+
+
+_COALESCE_ENABLED = os.getenv("SERPER_COALESCE", "").lower() in ("1", "true", "yes")
+# One coalescer per API key, so a batch is always sent with its callers' credentials
+_COALESCERS: dict[str, _Coalescer] = {}
+_COALESCER_LOCK = threading.Lock()
+# Longest a coalesced search waits for its batch: every retry timing out plus the
+# capped Retry-After waits between them
+_COALESCE_TIMEOUT = 120.0
+
+
+def _get_coalescer(api_key: str, run_many) -> _Coalescer:
+    """Return the coalescer for an API key, starting its worker thread on first use."""
+    coalescer = _COALESCERS.get(api_key)
+    if coalescer is None:
+        with _COALESCER_LOCK:
+            coalescer = _COALESCERS.get(api_key)
+            if coalescer is None:
+                coalescer = _COALESCERS[api_key] = _Coalescer(run_many)
+    return coalescer
 
 
 class SerperSearchInput(BaseModel):
@@ -20,16 +223,160 @@ class AuditIqSerper(BaseTool):
     )
     args_schema: Type[BaseModel] = SerperSearchInput
 
+    _headers: Optional[dict] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        super().model_post_init(__context)
+        self._load_headers()
+
+    def _load_headers(self) -> Optional[dict]:
+        """Return the request headers, reading SERPER_API_KEY only until it is found."""
+        if self._headers is None:
+            api_key = os.getenv("SERPER_API_KEY")
+            if api_key:
+                self._headers = {"X-API-KEY": api_key}
+        return self._headers
+
+    @classmethod
+    def _get_client(cls) -> httpx.Client:
+        """Return the shared SERPER HTTP/2 client, creating it on first use."""
+        global _CLIENT
+        if _CLIENT is None:
+            with _CLIENT_LOCK:
+                if _CLIENT is None:
+                    transport = httpx.HTTPTransport(
+                        http2=True,
+                        retries=2,
+                        limits=httpx.Limits(
+                            max_keepalive_connections=20,
+                            max_connections=40,
+                            keepalive_expiry=_KEEPALIVE_EXPIRY
+                        )
+                    )
+                    _CLIENT = httpx.Client(
+                        transport=transport,
+                        timeout=15.0,
+                        headers={"Content-Type": "application/json"}
+                    )
+        return _CLIENT
+
+    @classmethod
+    def _get_async_client(cls):
+        """Return the shared async client and semaphore for the running event loop."""
+        loop = asyncio.get_running_loop()
+        with _ASYNC_CLIENTS_LOCK:
+            entry = _ASYNC_CLIENTS.get(loop)
+            if entry is None:
+                for stale_loop in [other for other in _ASYNC_CLIENTS if other.is_closed()]:
+                    stale_client, _ = _ASYNC_CLIENTS.pop(stale_loop)
+                    closing = loop.create_task(_aclose_quietly(stale_client))
+                    _CLOSING_CLIENTS.add(closing)
+                    closing.add_done_callback(_CLOSING_CLIENTS.discard)
+                transport = httpx.AsyncHTTPTransport(
+                    http2=True,
+                    retries=2,
+                    limits=httpx.Limits(
+                        max_keepalive_connections=_ASYNC_MAX_CONCURRENCY,
+                        max_connections=_ASYNC_MAX_CONCURRENCY,
+                        keepalive_expiry=_KEEPALIVE_EXPIRY
+                    )
+                )
+                client = httpx.AsyncClient(
+                    transport=transport,
+                    timeout=15.0,
+                    headers={"Content-Type": "application/json"}
+                )
+                entry = _ASYNC_CLIENTS[loop] = (client, asyncio.Semaphore(_ASYNC_MAX_CONCURRENCY))
+        return entry
+
+    @staticmethod
+    def _format_results(query: str, data: dict) -> str:
+        """Format a SERPER response body into the tool's text output."""
+        # Process organic results
+        formatted_results = [
+            f"**Title:** {r.get('title') or 'No title'}\n"
+            f"**URL:** {r.get('link') or 'No link'}\n"
+            f"**Description:** {r.get('snippet') or 'No description available'}\n"
+            for r in data.get('organic') or ()
+        ]
+        
+        if formatted_results:
+            return f"Found {len(formatted_results)} web results for query '{query}':\n\n" + "\n---\n".join(formatted_results)
+        return f"No web results found for query: '{query}'"
+
+    @staticmethod
+    def _format_error(error: Exception) -> str:
+        """Map a request failure to the tool's error message."""
+        if isinstance(error, TimeoutException):
+            return "Error: SERPER API request timed out after 15 seconds. Please try again with a simpler query."
+        if isinstance(error, ConnectError):
+            return "Error: Unable to connect to SERPER API. Please check your internet connection."
+        if isinstance(error, HTTPStatusError):
+            return f"Error: SERPER API HTTP error: {str(error)}. Please check your SERPER_API_KEY."
+        if isinstance(error, HTTPError):
+            return f"Error making SERPER API request: {str(error)}"
+        # Before Python 3.11 the future timeout is not the builtin TimeoutError
+        if isinstance(error, (FutureTimeoutError, TimeoutError)):
+            return "Error: SERPER search timed out waiting for its batched request. Please try again."
+        return f"Error with web search: {str(error)}"
+
+    def _post(self, payload, headers: dict) -> httpx.Response:
+        """POST to SERPER over the shared client, pacing and retrying 429/5xx responses."""
+        client = self._get_client()
+        # Encode once with orjson; the client already sends Content-Type: application/json
+        body = orjson.dumps(payload)
+        for attempt in range(_MAX_RETRIES):
+            _BUCKET.acquire()
+            response = client.post(SERPER_URL, headers=headers, content=body)
+            if response.status_code not in _RETRY_STATUSES or attempt == _MAX_RETRIES - 1:
+                break
+            time.sleep(_retry_delay(response, attempt))
+        response.raise_for_status()
+        return response
+
+    def _run_many(self, queries: List[str], num_results: int = 5) -> List[str]:
+        """Run several searches in a single SERPER request and return one result per query."""
+        try:
+            headers = self._load_headers()
+            
+            if not headers:
+                return ["Error: SERPER API key not configured in environment variables."] * len(queries)
+            
+            results = [_cache_get(_cache_key(query, num_results)) for query in queries]
+            missing = [i for i, result in enumerate(results) if result is None]
+            if not missing:
+                return results
+            
+            # SERPER accepts a JSON array of searches and answers with an array in the same order
+            payload = [{"q": queries[i], "num": num_results} for i in missing]
+            response = self._post(payload, headers)
+            
+            for i, data in zip(missing, orjson.loads(response.content)):
+                results[i] = self._format_results(queries[i], data)
+                _cache_put(_cache_key(queries[i], num_results), results[i])
+            return [_MISSING_RESULT if result is None else result for result in results]
+            
+        except Exception as e:
+            return [self._format_error(e)] * len(queries)
+
     def _run(self, query: str, num_results: int = 5) -> str:
         try:
-            # Get SERPER API key from environment
-            api_key = os.getenv("SERPER_API_KEY")
+            # SERPER API key is read from the environment once and cached with the headers
+            headers = self._load_headers()
             
-            if not api_key:
+            if not headers:
                 return "Error: SERPER API key not configured in environment variables."
             
-            # SERPER API endpoint
-            url = "https://google.serper.dev/search"
+            # Serve repeated queries from the in-process cache
+            cache_key = _cache_key(query, num_results)
+            cached = _cache_get(cache_key)
+            if cached is not None:
+                return cached
+            
+            # Share one batch request with other concurrent searches when enabled
+            if _COALESCE_ENABLED:
+                coalescer = _get_coalescer(headers["X-API-KEY"], self._run_many)
+                return coalescer.submit(query, num_results).result(timeout=_COALESCE_TIMEOUT)
             
             # Prepare request payload
             payload = {
@@ -37,41 +384,48 @@ class AuditIqSerper(BaseTool):
                 "num": num_results
             }
             
-            headers = {
-                "X-API-KEY": api_key,
-                "Content-Type": "application/json"
-            }
+            # Make API request with 15 second timeout over the shared HTTP/2 client
+            response = self._post(payload, headers)
             
-            # Make API request with 15 second timeout
-            response = requests.post(url, headers=headers, json=payload, timeout=15)
-            response.raise_for_status()
+            result_text = self._format_results(query, orjson.loads(response.content))
+            _cache_put(cache_key, result_text)
+            return result_text
+                
+        except Exception as e:
+            return self._format_error(e)
+
+    async def _arun(self, query: str, num_results: int = 5) -> str:
+        """Async variant of _run so concurrent research queries overlap on the network."""
+        try:
+            headers = self._load_headers()
             
-            data = response.json()
+            if not headers:
+                return "Error: SERPER API key not configured in environment variables."
             
-            # Format results
-            formatted_results = []
+            cache_key = _cache_key(query, num_results)
+            cached = _cache_get(cache_key)
+            if cached is not None:
+                return cached
             
-            # Process organic results
-            organic_results = data.get('organic', [])
-            for result in organic_results:
-                title = result.get('title', 'No title')
-                snippet = result.get('snippet', 'No description available')
-                link = result.get('link', 'No link')
-                
-                formatted_results.append(f"**Title:** {title}\n**URL:** {link}\n**Description:** {snippet}\n")
+            payload = {
+                "q": query,
+                "num": num_results
+            }
+            
+            client, semaphore = self._get_async_client()
+            body = orjson.dumps(payload)
+            for attempt in range(_MAX_RETRIES):
+                await _BUCKET.acquire_async()
+                async with semaphore:
+                    response = await client.post(SERPER_URL, headers=headers, content=body)
+                if response.status_code not in _RETRY_STATUSES or attempt == _MAX_RETRIES - 1:
+                    break
+                await asyncio.sleep(_retry_delay(response, attempt))
+            response.raise_for_status()
+            
+            result_text = self._format_results(query, orjson.loads(response.content))
+            _cache_put(cache_key, result_text)
+            return result_text
             
-            if formatted_results:
-                return f"Found {len(formatted_results)} web results for query '{query}':\n\n" + "\n---\n".join(formatted_results)
-            else:
-                return f"No web results found for query: '{query}'"
-                
-        except requests.exceptions.Timeout:
-            return "Error: SERPER API request timed out after 15 seconds. Please try again with a simpler query."
-        except requests.exceptions.ConnectionError:
-            return "Error: Unable to connect to SERPER API. Please check your internet connection."
-        except requests.exceptions.HTTPError as e:
-            return f"Error: SERPER API HTTP error: {str(e)}. Please check your SERPER_API_KEY."
-        except requests.RequestException as e:
-            return f"Error making SERPER API request: {str(e)}"
         except Exception as e:
-            return f"Error with web search: {str(e)}"
+            return self._format_error(e)
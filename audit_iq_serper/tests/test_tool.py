@@ -4,9 +4,13 @@ Tests for the AuditIQ SERPER tool.
 """
 
 import os
+import asyncio
 import unittest
-from unittest.mock import patch, MagicMock
+import httpx
+import orjson
+from unittest.mock import patch, MagicMock, AsyncMock
 from audit_iq_serper import AuditIqSerper
+from audit_iq_serper.tool import clear_cache, _qps_from_env
 
 
 class TestAuditIqSerper(unittest.TestCase):
@@ -14,6 +18,7 @@ class TestAuditIqSerper(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures."""
+        clear_cache()
         self.tool = AuditIqSerper()
     
     def test_tool_initialization(self):
@@ -25,16 +30,17 @@ class TestAuditIqSerper(unittest.TestCase):
     @patch.dict(os.environ, {}, clear=True)
     def test_missing_api_key(self):
         """Test behavior when SERPER API key is missing."""
-        result = self.tool._run("test query")
+        tool = AuditIqSerper()
+        result = tool._run("test query")
         self.assertIn("SERPER API key not configured", result)
     
     @patch.dict(os.environ, {"SERPER_API_KEY": "test_key"})
-    @patch('audit_iq_serper.tool.requests.post')
-    def test_successful_search(self, mock_post):
+    @patch('audit_iq_serper.tool.AuditIqSerper._get_client')
+    def test_successful_search(self, mock_get_client):
         """Test successful search response."""
         # Mock successful API response
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "organic": [
                 {
                     "title": "Test Audit Regulation",
@@ -42,64 +48,198 @@ class TestAuditIqSerper(unittest.TestCase):
                     "link": "https://example.com/audit-reg"
                 }
             ]
-        }
+        })
         mock_response.raise_for_status.return_value = None
-        mock_post.return_value = mock_response
+        mock_get_client.return_value.post.return_value = mock_response
         
         result = self.tool._run("test audit query", 1)
         
         self.assertIn("Found 1 web results", result)
         self.assertIn("Test Audit Regulation", result)
         self.assertIn("https://example.com/audit-reg", result)
+        sent = mock_get_client.return_value.post.call_args.kwargs["content"]
+        self.assertEqual(orjson.loads(sent), {"q": "test audit query", "num": 1})
+    
+    @patch.dict(os.environ, {"SERPER_API_KEY": "test_key"})
+    @patch('audit_iq_serper.tool.AuditIqSerper._get_client')
+    def test_repeated_query_served_from_cache(self, mock_get_client):
+        """Test that an identical query does not hit the API twice."""
+        mock_response = MagicMock()
+        mock_response.content = orjson.dumps({
+            "organic": [
+                {
+                    "title": "Cached Regulation",
+                    "snippet": "Cached details...",
+                    "link": "https://example.com/cached"
+                }
+            ]
+        })
+        mock_response.raise_for_status.return_value = None
+        mock_get_client.return_value.post.return_value = mock_response
+        
+        first = self.tool._run("Cached Query", 1)
+        second = self.tool._run("  cached query ", 1)
+        
+        self.assertEqual(first, second)
+        self.assertEqual(mock_get_client.return_value.post.call_count, 1)
     
     @patch.dict(os.environ, {"SERPER_API_KEY": "test_key"})
-    @patch('audit_iq_serper.tool.requests.post')
-    def test_no_results(self, mock_post):
+    @patch('audit_iq_serper.tool.AuditIqSerper._get_client')
+    def test_no_results(self, mock_get_client):
         """Test response when no results are found."""
         # Mock API response with no results
         mock_response = MagicMock()
-        mock_response.json.return_value = {"organic": []}
+        mock_response.content = orjson.dumps({"organic": []})
         mock_response.raise_for_status.return_value = None
-        mock_post.return_value = mock_response
+        mock_get_client.return_value.post.return_value = mock_response
         
         result = self.tool._run("test query")
         
         self.assertIn("No web results found", result)
     
     @patch.dict(os.environ, {"SERPER_API_KEY": "test_key"})
-    @patch('audit_iq_serper.tool.requests.post')
-    def test_timeout_error(self, mock_post):
+    @patch('audit_iq_serper.tool.AuditIqSerper._get_client')
+    def test_timeout_error(self, mock_get_client):
         """Test handling of timeout errors."""
-        import requests
-        mock_post.side_effect = requests.exceptions.Timeout()
+        mock_get_client.return_value.post.side_effect = httpx.TimeoutException("timed out")
         
         result = self.tool._run("test query")
         
         self.assertIn("SERPER API request timed out", result)
     
     @patch.dict(os.environ, {"SERPER_API_KEY": "test_key"})
-    @patch('audit_iq_serper.tool.requests.post')
-    def test_connection_error(self, mock_post):
+    @patch('audit_iq_serper.tool.AuditIqSerper._get_client')
+    def test_connection_error(self, mock_get_client):
         """Test handling of connection errors."""
-        import requests
-        mock_post.side_effect = requests.exceptions.ConnectionError()
+        mock_get_client.return_value.post.side_effect = httpx.ConnectError("connection refused")
         
         result = self.tool._run("test query")
         
         self.assertIn("Unable to connect to SERPER API", result)
     
     @patch.dict(os.environ, {"SERPER_API_KEY": "test_key"})
-    @patch('audit_iq_serper.tool.requests.post')
-    def test_http_error(self, mock_post):
+    @patch('audit_iq_serper.tool.AuditIqSerper._get_client')
+    def test_http_error(self, mock_get_client):
         """Test handling of HTTP errors."""
-        import requests
-        mock_post.side_effect = requests.exceptions.HTTPError("401 Unauthorized")
+        mock_get_client.return_value.post.side_effect = httpx.HTTPStatusError(
+            "401 Unauthorized", request=MagicMock(), response=MagicMock()
+        )
         
         result = self.tool._run("test query")
         
         self.assertIn("SERPER API HTTP error", result)
         self.assertIn("check your SERPER_API_KEY", result)
+    
+    @patch.dict(os.environ, {"SERPER_API_KEY": "test_key"})
+    @patch('audit_iq_serper.tool.AuditIqSerper._get_async_client')
+    def test_async_search(self, mock_get_async_client):
+        """Test the async search path."""
+        mock_response = MagicMock()
+        mock_response.content = orjson.dumps({
+            "organic": [
+                {
+                    "title": "Async Regulation",
+                    "snippet": "Async details...",
+                    "link": "https://example.com/async"
+                }
+            ]
+        })
+        mock_response.raise_for_status.return_value = None
+        mock_client = MagicMock()
+        mock_client.post = AsyncMock(return_value=mock_response)
+        mock_get_async_client.return_value = (mock_client, asyncio.Semaphore(1))
+        
+        result = asyncio.run(self.tool._arun("async query", 1))
+        
+        self.assertIn("Found 1 web results", result)
+        self.assertIn("Async Regulation", result)
+    
+    @patch.dict(os.environ, {"SERPER_API_KEY": "test_key"})
+    @patch('audit_iq_serper.tool.time.sleep')
+    @patch('audit_iq_serper.tool.AuditIqSerper._get_client')
+    def test_retry_on_rate_limit(self, mock_get_client, mock_sleep):
+        """Test that a 429 response is retried after the Retry-After delay."""
+        throttled = MagicMock()
+        throttled.status_code = 429
+        throttled.headers = {"Retry-After": "2"}
+        ok = MagicMock()
+        ok.status_code = 200
+        ok.content = orjson.dumps({"organic": []})
+        ok.raise_for_status.return_value = None
+        mock_get_client.return_value.post.side_effect = [throttled, ok]
+        
+        result = self.tool._run("rate limited query", 5)
+        
+        self.assertIn("No web results found", result)
+        self.assertEqual(mock_get_client.return_value.post.call_count, 2)
+        mock_sleep.assert_called_with(2.0)
+    
+    @patch.dict(os.environ, {"SERPER_API_KEY": "test_key"})
+    @patch('audit_iq_serper.tool.time.sleep')
+    @patch('audit_iq_serper.tool.AuditIqSerper._get_client')
+    def test_retry_after_is_capped(self, mock_get_client, mock_sleep):
+        """Test that a large Retry-After value is capped at 30 seconds."""
+        throttled = MagicMock()
+        throttled.status_code = 429
+        throttled.headers = {"Retry-After": "3600"}
+        ok = MagicMock()
+        ok.status_code = 200
+        ok.content = orjson.dumps({"organic": []})
+        ok.raise_for_status.return_value = None
+        mock_get_client.return_value.post.side_effect = [throttled, ok]
+        
+        self.tool._run("slow down query", 5)
+        
+        mock_sleep.assert_called_with(30)
+    
+    @patch.dict(os.environ, {"SERPER_API_KEY": "test_key"})
+    @patch('audit_iq_serper.tool.AuditIqSerper._get_client')
+    def test_run_many_batches_queries(self, mock_get_client):
+        """Test that several queries share one request and are split back per query."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps([
+            {"organic": [{"title": "First", "snippet": "One", "link": "https://example.com/1"}]},
+            {"organic": []}
+        ])
+        mock_response.raise_for_status.return_value = None
+        mock_get_client.return_value.post.return_value = mock_response
+        
+        results = self.tool._run_many(["first query", "second query"], 1)
+        
+        self.assertEqual(mock_get_client.return_value.post.call_count, 1)
+        self.assertIn("First", results[0])
+        self.assertIn("No web results found for query: 'second query'", results[1])
+
+    
+    @patch.dict(os.environ, {"SERPER_API_KEY": "test_key"})
+    @patch('audit_iq_serper.tool.AuditIqSerper._get_client')
+    def test_run_many_fills_missing_results(self, mock_get_client):
+        """Test that queries missing from a short batch response get an error string."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps([{"organic": []}])
+        mock_response.raise_for_status.return_value = None
+        mock_get_client.return_value.post.return_value = mock_response
+        
+        results = self.tool._run_many(["first query", "second query"], 1)
+        
+        self.assertEqual(len(results), 2)
+        self.assertIn("No web results found", results[0])
+        self.assertTrue(results[1].startswith("Error"))
+
+    
+    @patch.dict(os.environ, {"SERPER_QPS": "fast"})
+    def test_invalid_qps_uses_default(self):
+        """Test that a non-numeric SERPER_QPS falls back to the default rate."""
+        self.assertEqual(_qps_from_env(), 5.0)
+    
+    def test_non_positive_qps_is_clamped(self):
+        """Test that a zero or negative SERPER_QPS is raised to the minimum rate."""
+        for value in ("0", "-3"):
+            with patch.dict(os.environ, {"SERPER_QPS": value}):
+                self.assertGreater(_qps_from_env(), 0)
 
 
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    unittest.main()
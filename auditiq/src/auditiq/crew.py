@@ -1,8 +1,178 @@
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
-from typing import List
-from auditiq.tools.custom_tool import EchoSearchTool, AuditSearchTool, SerperSearchTool, DocumentTranslationTool
+from crewai.events import crewai_event_bus, LLMCallStartedEvent, LLMStreamChunkEvent
+from typing import Generator, List
+import os
+import re
+import asyncio
+import time
+import queue
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from auditiq.tools.custom_tool import (
+    get_echo_search_tool,
+    get_audit_search_tool,
+    get_serper_search_tool,
+    get_document_translation_tool,
+)
+
+# Queries that unambiguously ask to translate a document skip the routing LLM call
+_FAST_ROUTES = (
+    (re.compile(r"\btranslate\b.*\.(?:pdf|docx)\b", re.IGNORECASE), "TRANSLATE"),
+)
+
+# Specialized (agent, task) factory names for each routing decision
+_DISPATCH = {
+    'ECHO': ('echo_rag_agent', 'echo_task'),
+    'AUDIT': ('audit_rag_agent', 'audit_task'),
+    'TRANSLATE': ('document_translator', 'document_translation_task'),
+}
+_DEFAULT_ROUTE = ('audit_researcher', 'research_task')
+
+# Leading word of the router's answer, e.g. "ECHO - because ..." -> "ECHO"
+_ROUTE_WORD = re.compile(r"\W*([A-Za-z]+)")
+
+# Routing decisions keyed by normalized query hash: key -> (stored_at, decision).
+# Shared across instances and threads, so it is locked and evicts oldest-first.
+_ROUTE_CACHE: dict[str, tuple[float, str]] = {}
+_ROUTE_CACHE_LOCK = threading.Lock()
+_ROUTE_CACHE_MAX_ENTRIES = 1024
+# How long a routing decision is reused for the same query (seconds)
+_ROUTE_TTL = 3600
+
+# Keyword heuristic used to guess the route while the router is still running.
+# Ties go to the earlier route listed.
+_PREDICTED_ROUTES = (
+    ("TRANSLATE", ("translate", "translation")),
+    ("ECHO", ("gt", "guideline", "guidelines", "policy", "policies")),
+    ("RESEARCH", ("current", "latest", "recent", "new", "trend", "trends", "update", "updates")),
+    ("AUDIT", ("methodology", "methodologies", "technique", "techniques", "procedure", "procedures", "sampling")),
+)
+# Every keyword is a single word, so one token -> route lookup replaces the keyword scans
+_PREDICT_TOKENS = {keyword: route for route, keywords in _PREDICTED_ROUTES for keyword in keywords}
+_WORD_RE = re.compile(r"\w+")
+# Routes worth guessing. A step callback only stops a discarded guess after its current
+# tool call, so TRANSLATE, whose tool writes translated files, is never started early.
+_SPECULATIVE_ROUTES = frozenset(('ECHO', 'AUDIT', 'RESEARCH'))
+# Words that settle the hint on their own; the first one present wins without scoring
+_ANCHOR_RE = re.compile(r"\b(?:(?P<TRANSLATE>translate)|(?P<AUDIT>methodology)|(?P<ECHO>policy))\b")
+
+
+def _route_cache_get(key: str):
+    """Return a cached routing decision if it is still fresh, refreshing its LRU position"""
+    with _ROUTE_CACHE_LOCK:
+        entry = _ROUTE_CACHE.pop(key, None)
+        if entry is None or time.monotonic() - entry[0] >= _ROUTE_TTL:
+            return None
+        _ROUTE_CACHE[key] = entry
+        return entry[1]
+
+
+def _route_cache_put(key: str, decision: str) -> None:
+    """Store a routing decision, evicting the oldest 10% of entries when the cache is full"""
+    with _ROUTE_CACHE_LOCK:
+        _ROUTE_CACHE[key] = (time.monotonic(), decision)
+        if len(_ROUTE_CACHE) > _ROUTE_CACHE_MAX_ENTRIES:
+            for old_key in list(_ROUTE_CACHE)[:_ROUTE_CACHE_MAX_ENTRIES // 10]:
+                del _ROUTE_CACHE[old_key]
+
+
+class _AnswerStream:
+    """Queues the final-answer text of one task's streamed LLM output"""
+
+    _MARKER = "Final Answer:"
+
+    def __init__(self):
+        self.chunks: queue.Queue = queue.Queue()
+        self.start_call()
+
+    def start_call(self) -> None:
+        """Forget the previous LLM call's text; each call may be a Thought/Action step"""
+        self._buffer = ""
+        self._answering = False
+
+    def feed(self, chunk: str) -> None:
+        """Queue the chunk if it is part of the answer, holding text until the marker shows up"""
+        if self._answering:
+            self.chunks.put(chunk)
+            return
+        self._buffer += chunk
+        at = self._buffer.find(self._MARKER)
+        if at >= 0:
+            self._answering = True
+            answer = self._buffer[at + len(self._MARKER):].lstrip()
+            if answer:
+                self.chunks.put(answer)
+
+
+# Task id -> answer stream of the kickoff_intelligent_routing_stream call running that
+# task. One bus handler fans chunks out, so concurrent streams only see their own.
+_ANSWER_STREAMS: dict[str, _AnswerStream] = {}
+_ANSWER_STREAMS_LOCK = threading.Lock()
+
+
+def _answer_stream_for(event):
+    """The answer stream registered for an event's task, if any"""
+    with _ANSWER_STREAMS_LOCK:
+        return _ANSWER_STREAMS.get(str(event.task_id))
+
+
+@crewai_event_bus.on(LLMCallStartedEvent)
+def _start_stream_call(source, event: LLMCallStartedEvent) -> None:
+    """Reset a stream's answer detection at the start of each LLM call of its task"""
+    stream = _answer_stream_for(event)
+    if stream is not None:
+        stream.start_call()
+
+
+@crewai_event_bus.on(LLMStreamChunkEvent)
+def _dispatch_stream_chunk(source, event: LLMStreamChunkEvent) -> None:
+    """Forward a streamed LLM text chunk to the stream consuming its task, if any"""
+    stream = _answer_stream_for(event)
+    if stream is not None and event.tool_call is None:
+        stream.feed(event.chunk)
+
+
+class _CrewCancelled(Exception):
+    """Raised from a step callback to stop a crew whose result is no longer wanted"""
+
+
+def _cancellable_copy(specialized_crew: Crew) -> tuple[Crew, threading.Event]:
+    """Copy a crew with a step callback that stops it at its next agent step once the event is set"""
+    crew_copy = specialized_crew.copy()
+    cancelled = threading.Event()
+
+    def _stop_if_cancelled(step) -> None:
+        if cancelled.is_set():
+            raise _CrewCancelled("crew run was abandoned")
+
+    crew_copy.step_callback = _stop_if_cancelled
+    return crew_copy, cancelled
+
+
+@lru_cache(maxsize=2048)
+def _classify(query_lower: str):
+    """Route hint for an already-lowercased query, or None when no keyword matches"""
+    anchor = _ANCHOR_RE.search(query_lower)
+    if anchor:
+        return anchor.lastgroup
+    scores = dict.fromkeys((route for route, _ in _PREDICTED_ROUTES), 0)
+    tokens = _WORD_RE.findall(query_lower)
+    remaining = len(tokens)
+    for token in tokens:
+        remaining -= 1
+        route = _PREDICT_TOKENS.get(token)
+        if route:
+            scores[route] += 1
+            # Stop once no other route can catch up with the remaining tokens
+            if scores[route] - max(v for r, v in scores.items() if r != route) > remaining:
+                return route
+    best = max(scores, key=scores.get)
+    return best if scores[best] else None
+
 
 @CrewBase
 class Auditiq():
@@ -11,6 +181,10 @@ class Auditiq():
     agents_config = 'config/agents.yaml'
     tasks_config = 'config/tasks.yaml'
 
+    def __init__(self):
+        # Specialized crews built on first use per route and reused for later queries
+        self._crews: dict[str, Crew] = {}
+
     @agent
     def query_router(self) -> Agent:
         """Agent that determines whether a query needs Q&A or research approach"""
@@ -24,7 +198,7 @@ class Auditiq():
         """Agent that searches GT Guidelines and Policy using echo index"""
         return Agent(
             config=self.agents_config['echo_rag_agent'], # type: ignore[index]
-            tools=[EchoSearchTool()],
+            tools=[get_echo_search_tool()],
             verbose=True
         )
 
@@ -33,7 +207,7 @@ class Auditiq():
         """Agent that searches audit methodology using audit-iq index"""
         return Agent(
             config=self.agents_config['audit_rag_agent'], # type: ignore[index]
-            tools=[AuditSearchTool()],
+            tools=[get_audit_search_tool()],
             verbose=True
         )
 
@@ -42,7 +216,7 @@ class Auditiq():
         """Agent that conducts web research using SERPER API"""
         return Agent(
             config=self.agents_config['audit_researcher'], # type: ignore[index]
-            tools=[SerperSearchTool()],
+            tools=[get_serper_search_tool()],
             verbose=True
         )
 
@@ -51,7 +225,7 @@ class Auditiq():
         """Agent that translates documents (PDF or DOCX) while preserving formatting"""
         return Agent(
             config=self.agents_config['document_translator'], # type: ignore[index]
-            tools=[DocumentTranslationTool()],
+            tools=[get_document_translation_tool()],
             verbose=True
         )
 
@@ -91,39 +265,21 @@ class Auditiq():
         )
 
     def create_dynamic_crew(self, query_type: str) -> Crew:
-        """Creates a crew based on the determined query type"""
-        if query_type.upper().startswith('ECHO'):
-            # ECHO workflow: Use GT Guidelines and Policy agent
-            return Crew(
-                agents=[self.echo_rag_agent()],
-                tasks=[self.echo_task()],
-                process=Process.sequential,
-                verbose=True,
-            )
-        elif query_type.upper().startswith('AUDIT'):
-            # AUDIT workflow: Use audit methodology agent
-            return Crew(
-                agents=[self.audit_rag_agent()],
-                tasks=[self.audit_task()],
-                process=Process.sequential,
-                verbose=True,
-            )
-        elif query_type.upper().startswith('TRANSLATE'):
-            # Translation workflow: Use only document translator agent
-            return Crew(
-                agents=[self.document_translator()],
-                tasks=[self.document_translation_task()],
-                process=Process.sequential,
-                verbose=True,
-            )
-        else:
-            # Research workflow: Use only research agent
-            return Crew(
-                agents=[self.audit_researcher()],
-                tasks=[self.research_task()],
+        """Returns the crew for the determined query type, building it on first use"""
+        key = self._route_key(query_type)
+        specialized_crew = self._crews.get(key)
+        if specialized_crew is None:
+            # ECHO: GT Guidelines and Policy, AUDIT: audit methodology,
+            # TRANSLATE: document translator, anything else: web research
+            agent_name, task_name = _DISPATCH.get(key, _DEFAULT_ROUTE)
+            specialized_crew = Crew(
+                agents=[getattr(self, agent_name)()],
+                tasks=[getattr(self, task_name)()],
                 process=Process.sequential,
                 verbose=True,
             )
+            self._crews[key] = specialized_crew
+        return specialized_crew
 
     @crew
     def crew(self) -> Crew:
@@ -135,6 +291,64 @@ class Auditiq():
             verbose=True,
         )
 
+    @staticmethod
+    def _route_cache_key(user_query: str) -> str:
+        return hashlib.sha1(user_query.lower().strip().encode()).hexdigest()
+
+    @staticmethod
+    def _route_key(query_type: str) -> str:
+        """Normalize a routing decision to ECHO, AUDIT, TRANSLATE or RESEARCH"""
+        match = _ROUTE_WORD.match(query_type)
+        key = match.group(1).upper() if match else ''
+        return key if key in _DISPATCH else 'RESEARCH'
+
+    @staticmethod
+    def _predict_route(user_query: str):
+        """Cheap keyword guess of the route, or None when nothing matches"""
+        return _classify(user_query.lower().strip())
+
+    def _known_route(self, inputs: dict):
+        """Return the route from the fast path or cache without calling the router, if possible"""
+        user_query = str(inputs.get('user_query', ''))
+        for pattern, decision in _FAST_ROUTES:
+            if pattern.search(user_query):
+                return decision
+
+        return _route_cache_get(self._route_cache_key(user_query))
+
+    def route_query(self, inputs: dict) -> str:
+        """Determine the query type, using the fast path or cache before the routing crew"""
+        decision = self._known_route(inputs)
+        if decision is not None:
+            return decision
+
+        routing_result = self.crew().kickoff(inputs=inputs)
+        decision = str(routing_result).strip()
+        key = self._route_cache_key(str(inputs.get('user_query', '')))
+        _route_cache_put(key, decision)
+        return decision
+
+    def _kickoff_speculative(self, inputs: dict, predicted: str) -> str:
+        """Run the predicted specialized crew alongside the router and keep it if the guess was right"""
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            # The guess runs on a copy (its own agents and tasks) so a discarded run never
+            # touches the cached crew, and is stopped at its next step if routing disagrees
+            speculative_crew, cancelled = _cancellable_copy(self.create_dynamic_crew(predicted))
+            speculative_future = executor.submit(speculative_crew.kickoff, inputs=inputs)
+            routing_decision = self.route_query(inputs)
+            print(f"Routing decision: {routing_decision} (predicted {predicted})")
+
+            if self._route_key(routing_decision) == predicted:
+                return str(speculative_future.result())
+
+            speculative_future.cancel()
+            cancelled.set()
+            return str(self.create_dynamic_crew(routing_decision).kickoff(inputs=inputs))
+        finally:
+            # Don't wait on a discarded speculative crew
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def kickoff_intelligent_routing(self, inputs: dict) -> str:
         """
         Intelligent routing workflow:
@@ -143,12 +357,15 @@ class Auditiq():
         3. Return the final result
         """
         try:
+            # Optionally start the most likely crew while the router decides
+            if os.getenv("AUDITIQ_SPECULATIVE_ROUTING", "").lower() in ("1", "true", "yes"):
+                if self._known_route(inputs) is None:
+                    predicted = self._predict_route(str(inputs.get('user_query', '')))
+                    if predicted in _SPECULATIVE_ROUTES:
+                        return self._kickoff_speculative(inputs, predicted)
+
             # Step 1: Route the query
-            routing_crew = self.crew()
-            routing_result = routing_crew.kickoff(inputs=inputs)
-            
-            # Extract the routing decision from the result
-            routing_decision = str(routing_result).strip()
+            routing_decision = self.route_query(inputs)
             print(f"Routing decision: {routing_decision}")
             
             # Step 2: Create and execute appropriate crew based on routing
@@ -159,3 +376,84 @@ class Auditiq():
             
         except Exception as e:
             return f"Error in intelligent routing workflow: {str(e)}"
+
+    def kickoff_intelligent_routing_stream(self, inputs: dict) -> Generator[str, None, str]:
+        """
+        Streaming variant of kickoff_intelligent_routing.
+        Streams the final task's LLM output and yields the text of its final answer as it
+        is generated, skipping Thought/Action steps and tool calls, then returns the final
+        result. If nothing was streamed, the final result is yielded once at the end.
+        Closing the generator early stops the crew at its next agent step.
+        """
+        try:
+            routing_decision = self.route_query(inputs)
+        except Exception as e:
+            error = f"Error in intelligent routing workflow: {str(e)}"
+            yield error
+            return error
+        print(f"Routing decision: {routing_decision}")
+
+        # Runs on a copy so an abandoned stream never leaves the cached crew mid-kickoff
+        specialized_crew, cancelled = _cancellable_copy(self.create_dynamic_crew(routing_decision))
+        final_task = specialized_crew.tasks[-1]
+        # The copy's LLM is its own shallow copy, so the cached crew keeps streaming off
+        final_llm = final_task.agent.llm
+        if hasattr(final_llm, 'stream'):
+            final_llm.stream = True
+        task_id = str(final_task.id)
+
+        answer = _AnswerStream()
+        chunks = answer.chunks
+        done = object()
+        outcome: dict = {}
+
+        def _kickoff() -> None:
+            try:
+                outcome['result'] = str(specialized_crew.kickoff(inputs=inputs))
+            except Exception as e:
+                outcome['result'] = f"Error in intelligent routing workflow: {str(e)}"
+            finally:
+                chunks.put(done)
+
+        with _ANSWER_STREAMS_LOCK:
+            _ANSWER_STREAMS[task_id] = answer
+        try:
+            threading.Thread(target=_kickoff, daemon=True).start()
+            streamed = False
+            while (chunk := chunks.get()) is not done:
+                streamed = True
+                yield chunk
+        finally:
+            cancelled.set()
+            with _ANSWER_STREAMS_LOCK:
+                _ANSWER_STREAMS.pop(task_id, None)
+
+        if not streamed:
+            yield outcome['result']
+        return outcome['result']
+
+    async def akickoff_many(self, inputs_list: List[dict]) -> List[str]:
+        """
+        Run intelligent routing for several queries concurrently.
+        Concurrency is capped by AUDITIQ_MAX_CONCURRENCY (default 8).
+        """
+        max_workers = max(1, int(os.getenv("AUDITIQ_MAX_CONCURRENCY", "8")))
+        # Crews aren't safe to kick off from several threads at once, so each worker gets
+        # its own instance, built on first need and reused for later queries; tools and
+        # the route cache stay shared
+        idle: asyncio.Queue = asyncio.Queue()
+        built = 0
+
+        async def _kickoff_one(inputs: dict) -> str:
+            nonlocal built
+            if idle.empty() and built < max_workers:
+                built += 1
+                instance = await asyncio.to_thread(type(self))
+            else:
+                instance = await idle.get()
+            try:
+                return await asyncio.to_thread(instance.kickoff_intelligent_routing, inputs)
+            finally:
+                idle.put_nowait(instance)
+
+        return list(await asyncio.gather(*(_kickoff_one(inputs) for inputs in inputs_list)))
@@ -2,12 +2,10 @@
 import sys
 import warnings
 import os
+import argparse
 
 from datetime import datetime
-
-from auditiq.crew import Auditiq
-
-warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
+from functools import lru_cache
 
 def startup_health_check():
     """Perform startup health checks to identify potential deployment issues."""
@@ -23,18 +21,17 @@ def startup_health_check():
         "AzureSearchAdminKey"
     ]
     
-    for var in required_env_vars:
-        if not os.getenv(var):
-            issues.append(f"Missing required environment variable: {var}")
+    env = os.environ
+    issues.extend(
+        f"Missing required environment variable: {var}"
+        for var in required_env_vars if not env.get(var)
+    )
     
     # Check environment variable formats
-    search_endpoint = os.getenv("AzureSearchEnpoint")
-    if search_endpoint and not search_endpoint.startswith("https://"):
-        issues.append("AzureSearchEnpoint should start with https://")
-    
-    azure_base = os.getenv("AZURE_API_BASE")
-    if azure_base and not azure_base.startswith("https://"):
-        issues.append("AZURE_API_BASE should start with https://")
+    for var in ("AzureSearchEnpoint", "AZURE_API_BASE"):
+        value = env.get(var)
+        if value and not value.startswith("https://"):
+            issues.append(f"{var} should start with https://")
     
     if issues:
         print(f"⚠️  Found {len(issues)} startup issues:")
@@ -46,46 +43,96 @@ def startup_health_check():
     
     return len(issues) == 0
 
-def run():
+def _build_crew():
+    # CrewAI is imported lazily so argument/env errors return without loading it.
+    # pysbd (pulled in by CrewAI) emits SyntaxWarnings on import; silence them only here.
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
+        from auditiq.crew import Auditiq
+        return Auditiq()
+
+@lru_cache(maxsize=1)
+def _cached_crew():
+    return _build_crew()
+
+def _get_crew():
+    """Return the shared Auditiq crew, or a fresh one when AUDITIQ_DISABLE_CACHE is set."""
+    if os.getenv("AUDITIQ_DISABLE_CACHE", "").lower() in ("1", "true", "yes"):
+        return _build_crew()
+    return _cached_crew()
+
+def _build_inputs(user_query: str, current_year: str = None) -> dict:
+    """Build crew inputs, reading the clock once per invocation."""
+    return {
+        'user_query': user_query,
+        'current_year': current_year or str(datetime.now().year)
+    }
+
+def _parse_query(banner: str, prompt: str, user_query: str = None) -> str:
+    """Return the given or command line query, or show the banner and prompt for it."""
+    if user_query is None:
+        user_query = " ".join(sys.argv[1:])
+    user_query = user_query.strip()
+    if user_query:
+        return user_query
+    
+    # Interactive input handling
+    print(banner)
+    return input(prompt).strip()
+
+# Where run() writes the formatted response
+_RESPONSE_FILE = "audit_response.md"
+
+def _write_stream(stream, response_file) -> str:
+    """Copy each streamed chunk to the file and stdout, returning the stream's final result."""
+    while True:
+        try:
+            chunk = next(stream)
+        except StopIteration as stop:
+            return stop.value
+        response_file.write(chunk)
+        sys.stdout.write(chunk)
+        sys.stdout.flush()
+
+def run(user_query: str = None):
     """
     Run the crew with user query input.
     """
     # Perform startup health check
     startup_health_check()
     
-    # Check if user provided a query as command line argument
-    if len(sys.argv) > 1:
-        user_query = " ".join(sys.argv[1:])
-    else:
-        # Interactive input handling
-        print("🔍 AuditIQ - Intelligent Multi-Agent Audit System")
-        print("📚 Test dual index system:")
-        print("   • Policy queries → audit-iq index (policies, regulations, compliance)")
-        print("   • Methodology queries → echo index (procedures, techniques, how-to)")
-        print()
-        user_query = input("Enter your audit query: ").strip()
-    
-    if not user_query.strip():
+    # Use the command line query if given, otherwise prompt interactively
+    user_query = _parse_query(
+        "🔍 AuditIQ - Intelligent Multi-Agent Audit System\n"
+        "📚 Test dual index system:\n"
+        "   • Policy queries → audit-iq index (policies, regulations, compliance)\n"
+        "   • Methodology queries → echo index (procedures, techniques, how-to)\n",
+        "Enter your audit query: ",
+        user_query
+    )
+    
+    if not user_query:
         print("Error: No query provided.")
         return
     
-    inputs = {
-        'user_query': user_query,
-        'current_year': str(datetime.now().year)
-    }
+    inputs = _build_inputs(user_query)
     
     try:
         print(f"🚀 Initializing AuditIQ crew...")
         # Use intelligent routing workflow
-        auditiq_crew = Auditiq()
+        auditiq_crew = _get_crew()
         print(f"✅ Crew initialized successfully")
         
         print(f"🔍 Processing query: {user_query}")
-        result = auditiq_crew.kickoff_intelligent_routing(inputs)
+        # Stream the response to the terminal and the response file as it is generated
+        stream = auditiq_crew.kickoff_intelligent_routing_stream(inputs)
+        with open(_RESPONSE_FILE, "w", encoding="utf-8") as response_file:
+            response_file.write(f"# Audit Intelligence Response\n\n**Query:** {user_query}\n\n**Response:**\n")
+            result = _write_stream(stream, response_file)
+            response_file.write(f"\n\n---\n*Generated on {datetime.now():%Y-%m-%d %H:%M:%S}*\n")
         
-        print(f"✅ Query processed successfully")
-        print(f"\nQuery: {user_query}")
-        print(f"Response:\n{result}")
+        print(f"\n✅ Query processed successfully")
+        print(f"📄 Response saved to {_RESPONSE_FILE}")
         return result
         
     except Exception as e:
@@ -93,32 +140,27 @@ def run():
         print(f"❌ Error: {error_msg}")
         raise Exception(error_msg)
 
-def run_qa():
+def run_qa(user_query: str = None):
     """
     Force Q&A mode - search internal knowledge base only.
     """
-    if len(sys.argv) > 1:
-        user_query = " ".join(sys.argv[1:])
-    else:
-        # Interactive input handling
-        print("🔍 AuditIQ - Q&A Mode (Internal Knowledge Base Only)")
-        print("📚 Searches dual index system:")
-        print("   • Policy queries → audit-iq index (policies, regulations, compliance)")
-        print("   • Methodology queries → echo index (procedures, techniques, how-to)")
-        print()
-        user_query = input("Enter your audit query for Q&A mode: ").strip()
-    
-    if not user_query.strip():
+    user_query = _parse_query(
+        "🔍 AuditIQ - Q&A Mode (Internal Knowledge Base Only)\n"
+        "📚 Searches dual index system:\n"
+        "   • Policy queries → audit-iq index (policies, regulations, compliance)\n"
+        "   • Methodology queries → echo index (procedures, techniques, how-to)\n",
+        "Enter your audit query for Q&A mode: ",
+        user_query
+    )
+    
+    if not user_query:
         print("Error: No query provided.")
         return
     
-    inputs = {
-        'user_query': user_query,
-        'current_year': str(datetime.now().year)
-    }
+    inputs = _build_inputs(user_query)
     
     try:
-        auditiq_crew = Auditiq()
+        auditiq_crew = _get_crew()
         qa_crew = auditiq_crew.create_dynamic_crew("QA")
         result = qa_crew.kickoff(inputs=inputs)
         
@@ -131,33 +173,28 @@ def run_qa():
         print(error_msg)
         raise Exception(error_msg)
 
-def run_research():
+def run_research(user_query: str = None):
     """
     Force research mode - web search only.
     """
-    if len(sys.argv) > 1:
-        user_query = " ".join(sys.argv[1:])
-    else:
-        # Interactive input handling
-        print("🔍 AuditIQ - Research Mode (Web Search Only)")
-        print("🌐 Searches current web information:")
-        print("   • Latest regulatory updates and compliance requirements")
-        print("   • Industry trends and emerging audit methodologies")
-        print("   • Recent changes in audit standards and practices")
-        print()
-        user_query = input("Enter your audit query for research mode: ").strip()
-    
-    if not user_query.strip():
+    user_query = _parse_query(
+        "🔍 AuditIQ - Research Mode (Web Search Only)\n"
+        "🌐 Searches current web information:\n"
+        "   • Latest regulatory updates and compliance requirements\n"
+        "   • Industry trends and emerging audit methodologies\n"
+        "   • Recent changes in audit standards and practices\n",
+        "Enter your audit query for research mode: ",
+        user_query
+    )
+    
+    if not user_query:
         print("Error: No query provided.")
         return
     
-    inputs = {
-        'user_query': user_query,
-        'current_year': str(datetime.now().year)
-    }
+    inputs = _build_inputs(user_query)
     
     try:
-        auditiq_crew = Auditiq()
+        auditiq_crew = _get_crew()
         research_crew = auditiq_crew.create_dynamic_crew("RESEARCH")
         result = research_crew.kickoff(inputs=inputs)
         
@@ -170,48 +207,156 @@ def run_research():
         print(error_msg)
         raise Exception(error_msg)
 
-def train():
+def run_batch(queries: list = None):
+    """
+    Run intelligent routing for many queries concurrently (read from stdin, one per line, if not given).
+    """
+    if queries is None:
+        queries = sys.stdin.read().splitlines()
+    queries = [query.strip() for query in queries if query.strip()]
+    
+    if not queries:
+        print("Error: No queries provided on stdin.")
+        return
+    
+    import asyncio
+    
+    current_year = str(datetime.now().year)
+    inputs_list = [_build_inputs(query, current_year) for query in queries]
+    
+    try:
+        auditiq_crew = _get_crew()
+        # Fan-out is capped by AUDITIQ_MAX_CONCURRENCY (default 8)
+        results = asyncio.run(auditiq_crew.akickoff_many(inputs_list))
+        
+        for query, result in zip(queries, results):
+            print(f"\nQuery: {query}")
+            print(f"Response:\n{result}")
+        return results
+        
+    except Exception as e:
+        error_msg = f"An error occurred while running the batch: {e}"
+        print(error_msg)
+        raise Exception(error_msg)
+
+def _argv_int_and_str(usage: str):
+    """Read `<int> <str>` from sys.argv, raising a usage error if they are missing or invalid."""
+    try:
+        return int(sys.argv[1]), sys.argv[2]
+    except (IndexError, ValueError):
+        raise ValueError(f"Usage: {usage} (n_iterations must be an integer)")
+
+def train(n_iterations: int = None, filename: str = None):
     """
     Train the crew for a given number of iterations.
     """
+    # Validate CLI arguments up front so bad input isn't reported as a training failure
+    if n_iterations is None or filename is None:
+        n_iterations, filename = _argv_int_and_str("train <n_iterations> <filename>")
+    
     # Use a sample query for training
-    inputs = {
-        "user_query": "What are the current SOX compliance requirements?",
-        'current_year': str(datetime.now().year)
-    }
+    inputs = _build_inputs("What are the current SOX compliance requirements?")
     try:
-        auditiq_crew = Auditiq()
-        auditiq_crew.crew().train(n_iterations=int(sys.argv[1]), filename=sys.argv[2], inputs=inputs)
+        auditiq_crew = _get_crew()
+        auditiq_crew.crew().train(n_iterations=n_iterations, filename=filename, inputs=inputs)
 
     except Exception as e:
         raise Exception(f"An error occurred while training the crew: {e}")
 
-def replay():
+def replay(task_id: str = None):
     """
     Replay the crew execution from a specific task.
     """
     try:
-        auditiq_crew = Auditiq()
-        auditiq_crew.crew().replay(task_id=sys.argv[1])
+        auditiq_crew = _get_crew()
+        auditiq_crew.crew().replay(task_id=task_id or sys.argv[1])
 
     except Exception as e:
         raise Exception(f"An error occurred while replaying the crew: {e}")
 
-def test():
+def test(n_iterations: int = None, eval_llm: str = None):
     """
     Test the crew execution and returns the results.
     """
-    inputs = {
-        "user_query": "What are the key audit controls for financial reporting?",
-        "current_year": str(datetime.now().year)
-    }
+    # Validate CLI arguments up front so bad input isn't reported as a test failure
+    if n_iterations is None or eval_llm is None:
+        n_iterations, eval_llm = _argv_int_and_str("test <n_iterations> <eval_llm>")
+    
+    inputs = _build_inputs("What are the key audit controls for financial reporting?")
     
     try:
-        auditiq_crew = Auditiq()
-        auditiq_crew.crew().test(n_iterations=int(sys.argv[1]), eval_llm=sys.argv[2], inputs=inputs)
+        auditiq_crew = _get_crew()
+        auditiq_crew.crew().test(n_iterations=n_iterations, eval_llm=eval_llm, inputs=inputs)
 
     except Exception as e:
         raise Exception(f"An error occurred while testing the crew: {e}")
 
+class _ArgvMismatch(Exception):
+    """Raised by _TrialParser when arguments don't fit the subcommand."""
+
+class _TrialParser(argparse.ArgumentParser):
+    """ArgumentParser that raises instead of printing usage and exiting."""
+    def error(self, message):
+        raise _ArgvMismatch(message)
+
+def _build_parser(parser_class=argparse.ArgumentParser) -> argparse.ArgumentParser:
+    """Build the `python -m auditiq.main` parser; subcommand parsers share its class."""
+    parser = parser_class(prog="auditiq", description="AuditIQ multi-agent audit crew")
+    subparsers = parser.add_subparsers(dest="cmd")
+    
+    for name in ("run", "qa", "research"):
+        subparser = subparsers.add_parser(name)
+        subparser.add_argument("user_query", nargs="*")
+    subparsers.add_parser("batch", help="read queries from stdin, one per line")
+    
+    train_parser = subparsers.add_parser("train")
+    train_parser.add_argument("n_iterations", type=int)
+    train_parser.add_argument("filename")
+    
+    replay_parser = subparsers.add_parser("replay")
+    replay_parser.add_argument("task_id")
+    
+    test_parser = subparsers.add_parser("test")
+    test_parser.add_argument("n_iterations", type=int)
+    test_parser.add_argument("eval_llm")
+    return parser
+
+def _is_command(argv: list) -> bool:
+    """Whether argv starts with a subcommand name and the rest fits that subcommand."""
+    if argv[0] not in _COMMANDS:
+        return False
+    try:
+        _build_parser(_TrialParser).parse_args(argv)
+    except _ArgvMismatch:
+        return False
+    return True
+
+def _parse(argv: list = None) -> argparse.Namespace:
+    """Parse `python -m auditiq.main <command> ...` arguments once."""
+    # A bare query (`python -m auditiq.main "my question"`) keeps meaning `run`, including
+    # one that merely starts with a command name, like "test our SOX controls"
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and not argv[0].startswith("-") and not _is_command(argv):
+        argv = ["run", *argv]
+    
+    args = _build_parser().parse_args(argv)
+    if args.cmd is None:
+        args.cmd = "run"
+        args.user_query = []
+    if isinstance(getattr(args, "user_query", None), list):
+        args.user_query = " ".join(args.user_query)
+    return args
+
+_COMMANDS = {
+    "run": run,
+    "qa": run_qa,
+    "research": run_research,
+    "batch": run_batch,
+    "train": train,
+    "replay": replay,
+    "test": test,
+}
+
 if __name__ == "__main__":
-    run()
+    args = vars(_parse())
+    _COMMANDS[args.pop("cmd")](**args)
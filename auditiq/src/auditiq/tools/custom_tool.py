@@ -1,13 +1,227 @@
 from crewai.tools import BaseTool
-from typing import Type, Optional, List, Dict, Any
+from typing import TYPE_CHECKING, Type, Optional, List, Dict, Any, ClassVar, Tuple, Mapping
+from types import MappingProxyType
 from pydantic import BaseModel, Field
 import os
-import requests
-from azure.search.documents import SearchClient
-from azure.core.credentials import AzureKeyCredential
-from azure.ai.translation.document import SingleDocumentTranslationClient
-from azure.ai.translation.document.models import DocumentTranslateContent
+import asyncio
+import io
+import httpx
+import orjson
 import json
+import logging
+import threading
+import time
+from functools import lru_cache
+from itertools import islice
+
+
+# The Azure SDKs are imported on first use: together they add a few hundred ms
+# to import time, which is wasted when a run only needs SERPER
+if TYPE_CHECKING:
+    from azure.search.documents import SearchClient
+    from azure.core.credentials import AzureKeyCredential
+    from azure.ai.translation.document import SingleDocumentTranslationClient
+
+
+logger = logging.getLogger(__name__)
+
+# Environment configuration, read once at import instead of on every tool call.
+# Tools re-read it when a value is missing or a service rejects the key (401/403), so a
+# rotated key is used from the next call on. Call _reload_env() after changing
+# os.environ yourself (e.g. in tests or after loading a .env file).
+AZURE_SEARCH_ENDPOINT: Optional[str] = None
+AZURE_SEARCH_KEY: Optional[str] = None
+AZURE_SEARCH_ECHO_INDEX: str = "echo"
+AZURE_SEARCH_AUDIT_INDEX: str = "audit-iq"
+SERPER_API_KEY: Optional[str] = None
+AZURE_DOCUMENT_TRANSLATION_ENDPOINT: Optional[str] = None
+AZURE_DOCUMENT_TRANSLATION_KEY: Optional[str] = None
+
+
+def _reload_env() -> None:
+    """Re-read the tools' environment variables into the module-level constants."""
+    global AZURE_SEARCH_ENDPOINT, AZURE_SEARCH_KEY, AZURE_SEARCH_ECHO_INDEX, AZURE_SEARCH_AUDIT_INDEX
+    global SERPER_API_KEY, AZURE_DOCUMENT_TRANSLATION_ENDPOINT, AZURE_DOCUMENT_TRANSLATION_KEY
+    env = os.environ
+    AZURE_SEARCH_ENDPOINT = env.get("AzureSearchEnpoint")
+    AZURE_SEARCH_KEY = env.get("AzureSearchAdminKey")
+    AZURE_SEARCH_ECHO_INDEX = env.get("AzureSearchIndexName2", "echo")
+    AZURE_SEARCH_AUDIT_INDEX = env.get("AzureSearchIndexName", "audit-iq")
+    SERPER_API_KEY = env.get("SERPER_API_KEY")
+    AZURE_DOCUMENT_TRANSLATION_ENDPOINT = env.get("AZURE_DOCUMENT_TRANSLATION_ENDPOINT")
+    AZURE_DOCUMENT_TRANSLATION_KEY = env.get("AZURE_DOCUMENT_TRANSLATION_KEY")
+
+
+_reload_env()
+
+_AUTH_FAILURE_STATUSES = frozenset((401, 403))
+
+
+def _reload_env_on_auth_failure(status_code: Optional[int]) -> None:
+    """Re-read the environment after a rejected key so a rotated one is picked up."""
+    if status_code in _AUTH_FAILURE_STATUSES:
+        _reload_env()
+
+
+@lru_cache(maxsize=None)
+def _get_credential(key: str) -> "AzureKeyCredential":
+    """Return the process-wide AzureKeyCredential for an API key."""
+    from azure.core.credentials import AzureKeyCredential
+    return AzureKeyCredential(key)
+
+
+# Recent search results so repeated questions across agent turns skip the round-trip:
+# key -> (stored_at, result text)
+_CACHE: Dict[tuple, tuple] = {}
+_CACHE_LOCK = threading.RLock()
+_CACHE_MAX_ENTRIES = 512
+_CACHE_TTL = 300.0
+
+
+def _cache_get(key: tuple) -> Optional[str]:
+    """Return a cached result if it is still fresh, refreshing its LRU position."""
+    with _CACHE_LOCK:
+        entry = _CACHE.pop(key, None)
+        if entry is None or time.monotonic() - entry[0] >= _CACHE_TTL:
+            return None
+        _CACHE[key] = entry
+        return entry[1]
+
+
+def _cache_put(key: tuple, value: str) -> None:
+    """Store a result, evicting the oldest 10% of entries when the cache is full."""
+    with _CACHE_LOCK:
+        _CACHE[key] = (time.monotonic(), value)
+        if len(_CACHE) > _CACHE_MAX_ENTRIES:
+            for old_key in list(_CACHE)[:_CACHE_MAX_ENTRIES // 10]:
+                del _CACHE[old_key]
+
+
+def clear_cache() -> None:
+    """Drop all cached search results."""
+    with _CACHE_LOCK:
+        _CACHE.clear()
+
+
+# One SearchClient per (endpoint, key, index) so repeated searches reuse its connection pool
+_SEARCH_CLIENTS: Dict[tuple, "SearchClient"] = {}
+_SEARCH_CLIENTS_LOCK = threading.Lock()
+
+
+def _get_search_client(endpoint: str, key: str, index_name: str) -> "SearchClient":
+    """Return the shared SearchClient for an index, creating it on first use."""
+    cache_key = (endpoint, key, index_name)
+    client = _SEARCH_CLIENTS.get(cache_key)
+    if client is None:
+        with _SEARCH_CLIENTS_LOCK:
+            client = _SEARCH_CLIENTS.get(cache_key)
+            if client is None:
+                from azure.search.documents import SearchClient
+                client = SearchClient(
+                    endpoint=endpoint,
+                    index_name=index_name,
+                    credential=_get_credential(key)
+                )
+                _SEARCH_CLIENTS[cache_key] = client
+    return client
+
+
+# One SingleDocumentTranslationClient per (endpoint, key) so translations reuse its HTTP pipeline
+_TRANSLATION_CLIENTS: Dict[tuple, "SingleDocumentTranslationClient"] = {}
+_TRANSLATION_CLIENTS_LOCK = threading.Lock()
+
+
+def _get_translation_client(endpoint: str, key: str) -> "SingleDocumentTranslationClient":
+    """Return the shared translation client for an endpoint, creating it on first use."""
+    cache_key = (endpoint, key)
+    client = _TRANSLATION_CLIENTS.get(cache_key)
+    if client is None:
+        with _TRANSLATION_CLIENTS_LOCK:
+            client = _TRANSLATION_CLIENTS.get(cache_key)
+            if client is None:
+                from azure.ai.translation.document import SingleDocumentTranslationClient
+                client = SingleDocumentTranslationClient(endpoint, _get_credential(key))
+                _TRANSLATION_CLIENTS[cache_key] = client
+    return client
+
+
+# Cap on simultaneous outbound Azure/SERPER requests from this process, so agent
+# fan-out queues locally instead of triggering throttling and retry storms
+_MAX_OUTBOUND_REQUESTS = int(os.getenv("AUDITIQ_MAX_OUTBOUND_REQUESTS", "5"))
+_OUTBOUND_SEM = threading.BoundedSemaphore(_MAX_OUTBOUND_REQUESTS)
+
+
+# Pooled HTTP/2 client so SERPER searches share one multiplexed TLS connection, created
+# on first search. The transport retries failed connects; throttling and gateway statuses
+# are retried in _run.
+_SERPER_TIMEOUT = httpx.Timeout(15.0, connect=3.05)
+_SERPER_CLIENT: Optional[httpx.Client] = None
+_SERPER_CLIENT_LOCK = threading.Lock()
+
+
+def _get_serper_client() -> httpx.Client:
+    """Return the shared SERPER client, creating it on first use."""
+    global _SERPER_CLIENT
+    if _SERPER_CLIENT is None:
+        with _SERPER_CLIENT_LOCK:
+            if _SERPER_CLIENT is None:
+                _SERPER_CLIENT = httpx.Client(
+                    transport=httpx.HTTPTransport(http2=True, retries=2, limits=httpx.Limits(max_connections=10)),
+                    timeout=_SERPER_TIMEOUT,
+                    headers={"Content-Type": "application/json"}
+                )
+    return _SERPER_CLIENT
+
+_SERPER_RETRY_STATUSES = frozenset((429, 502, 503, 504))
+_SERPER_MAX_RETRIES = 2
+
+# Async HTTP/2 client and request semaphore for concurrent SERPER searches, one pair
+# per event loop. A client whose loop has closed is shut down when a new loop arrives.
+_ASYNC_SERPER: Dict[asyncio.AbstractEventLoop, Tuple[httpx.AsyncClient, asyncio.Semaphore]] = {}
+_ASYNC_SERPER_LOCK = threading.Lock()
+# Pending close tasks, referenced so they aren't garbage collected mid-close
+_CLOSING_SERPER_CLIENTS: set = set()
+
+
+async def _aclose_quietly(client: httpx.AsyncClient) -> None:
+    """Close a client left over from an ended event loop; its sockets may already be gone."""
+    try:
+        await client.aclose()
+    except Exception as e:
+        logger.debug("Closing stale SERPER client failed: %s", e)
+
+
+def _get_async_serper() -> Tuple[httpx.AsyncClient, asyncio.Semaphore]:
+    """Return the async SERPER client and request semaphore for the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _ASYNC_SERPER_LOCK:
+        entry = _ASYNC_SERPER.get(loop)
+        if entry is None:
+            for stale_loop in [other for other in _ASYNC_SERPER if other.is_closed()]:
+                stale_client, _ = _ASYNC_SERPER.pop(stale_loop)
+                closing = loop.create_task(_aclose_quietly(stale_client))
+                _CLOSING_SERPER_CLIENTS.add(closing)
+                closing.add_done_callback(_CLOSING_SERPER_CLIENTS.discard)
+            client = httpx.AsyncClient(
+                http2=True,
+                timeout=_SERPER_TIMEOUT,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+                headers={"Content-Type": "application/json"}
+            )
+            entry = _ASYNC_SERPER[loop] = (client, asyncio.Semaphore(_MAX_OUTBOUND_REQUESTS))
+    return entry
+
+
+async def _gather_bounded(search, queries: List[str], top: int, max_concurrency: int) -> List[str]:
+    """Await search(query, top) for every query with at most max_concurrency in flight."""
+    # Keep fan-out small enough not to trip Azure Search throttling
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def search_one(query: str) -> str:
+        async with semaphore:
+            return await search(query, top)
+
+    return list(await asyncio.gather(*(search_one(query) for query in queries)))
 
 
 class AzureSearchInput(BaseModel):
@@ -26,68 +240,81 @@ class EchoSearchTool(BaseTool):
 
     def _run(self, query: str, top: int = 5) -> str:
         try:
-            # Get Azure Search configuration from environment
-            search_endpoint = os.getenv("AzureSearchEnpoint")
-            search_key = os.getenv("AzureSearchAdminKey")
+            # Pick up configuration set after import before reporting it missing
+            if not AZURE_SEARCH_ENDPOINT or not AZURE_SEARCH_KEY:
+                _reload_env()
+            search_endpoint = AZURE_SEARCH_ENDPOINT
+            search_key = AZURE_SEARCH_KEY
             
             if not search_endpoint or not search_key:
                 return "Error: Azure Search credentials not configured. Please check AzureSearchEnpoint and AzureSearchAdminKey in environment variables."
             
             # Use echo index for GT Guidelines and Policy
-            index_name = os.getenv("AzureSearchIndexName2", "echo")
+            index_name = AZURE_SEARCH_ECHO_INDEX
+            
+            cache_key = (index_name, query, top)
+            cached = _cache_get(cache_key)
+            if cached is not None:
+                return cached
             
-            # Initialize search client
+            # Get the shared search client for this index
             try:
-                credential = AzureKeyCredential(search_key)
-                search_client = SearchClient(
-                    endpoint=search_endpoint,
-                    index_name=index_name,
-                    credential=credential
-                )
+                search_client = _get_search_client(search_endpoint, search_key, index_name)
             except Exception as init_error:
                 return f"Error initializing Azure Search client: {str(init_error)}. Please check your Azure Search credentials and endpoint configuration."
             
             # Perform search with timeout (30 seconds)
-            import time
-            start_time = time.time()
-            try:
-                results = search_client.search(
-                    search_text=query,
-                    top=top,
-                    include_total_count=True
-                )
+            with _OUTBOUND_SEM:
+                start_time = time.monotonic()
+                try:
+                    results = search_client.search(
+                        search_text=query,
+                        top=top,
+                        select=["title", "content"]
+                    )
                 
-                results_list = list(results)
-                elapsed_time = time.time() - start_time
+                    # Stop at top so the pager never fetches a further page
+                    results_list = list(islice(results, top))
+                    elapsed_time = time.monotonic() - start_time
                 
-                if elapsed_time > 30:
-                    return f"Search timeout after {elapsed_time:.1f} seconds. Please try a simpler query."
+                    if elapsed_time > 30:
+                        return f"Search timeout after {elapsed_time:.1f} seconds. Please try a simpler query."
                     
-            except Exception as search_error:
-                elapsed_time = time.time() - start_time
-                if elapsed_time > 30:
-                    return f"Search timeout after {elapsed_time:.1f} seconds: {str(search_error)}"
-                raise search_error
-            
-            # Format results
-            formatted_results = []
-            for result in results_list:
-                result_dict = dict(result)
-                title = result_dict.get('title', 'No title')
-                content = result_dict.get('content', 'No content available')[:500]
-                score = result_dict.get('@search.score', 'N/A')
-                
-                formatted_results.append(f"**Title:** {title}\n**Score:** {score}\n**Content:** {content}...\n")
-            
-            if formatted_results:
-                header = f"Searched GT Guidelines and Policy index ({index_name}) and found {len(formatted_results)} results for query '{query}':\n\n"
-                return header + "\n---\n".join(formatted_results)
+                except Exception as search_error:
+                    elapsed_time = time.monotonic() - start_time
+                    if elapsed_time > 30:
+                        return f"Search timeout after {elapsed_time:.1f} seconds: {str(search_error)}"
+                    raise search_error
+            
+            if not results_list:
+                formatted = f"No results found in GT Guidelines and Policy index ({index_name}) for query: '{query}'"
             else:
-                return f"No results found in GT Guidelines and Policy index ({index_name}) for query: '{query}'"
+                # Format results into one buffer; results are already Mappings
+                buf = io.StringIO()
+                buf.write(f"Searched GT Guidelines and Policy index ({index_name}) and found {len(results_list)} results for query '{query}':\n\n")
+                for i, result in enumerate(results_list):
+                    if i:
+                        buf.write("\n---\n")
+                    buf.write(f"**Title:** {result.get('title', 'No title')}\n")
+                    buf.write(f"**Score:** {result.get('@search.score', 'N/A')}\n")
+                    buf.write(f"**Content:** {result.get('content', 'No content available')[:500]}...\n")
+                formatted = buf.getvalue()
+            
+            _cache_put(cache_key, formatted)
+            return formatted
                 
         except Exception as e:
+            _reload_env_on_auth_failure(getattr(e, "status_code", None))
             return f"Error searching GT Guidelines and Policy index: {str(e)}"
 
+    async def _arun(self, query: str, top: int = 5) -> str:
+        """Async variant of _run; the blocking search runs in a worker thread."""
+        return await asyncio.to_thread(self._run, query, top)
+
+    async def batch_search(self, queries: List[str], top: int = 5, max_concurrency: int = 8) -> List[str]:
+        """Run several searches concurrently, returning results in input order."""
+        return await _gather_bounded(self._arun, queries, top, max_concurrency)
+
 
 class AuditSearchTool(BaseTool):
     name: str = "audit_search_tool"
@@ -100,68 +327,81 @@ class AuditSearchTool(BaseTool):
 
     def _run(self, query: str, top: int = 5) -> str:
         try:
-            # Get Azure Search configuration from environment
-            search_endpoint = os.getenv("AzureSearchEnpoint")
-            search_key = os.getenv("AzureSearchAdminKey")
+            # Pick up configuration set after import before reporting it missing
+            if not AZURE_SEARCH_ENDPOINT or not AZURE_SEARCH_KEY:
+                _reload_env()
+            search_endpoint = AZURE_SEARCH_ENDPOINT
+            search_key = AZURE_SEARCH_KEY
             
             if not search_endpoint or not search_key:
                 return "Error: Azure Search credentials not configured. Please check AzureSearchEnpoint and AzureSearchAdminKey in environment variables."
             
             # Use audit-iq index for audit methodology
-            index_name = os.getenv("AzureSearchIndexName", "audit-iq")
+            index_name = AZURE_SEARCH_AUDIT_INDEX
             
-            # Initialize search client
+            cache_key = (index_name, query, top)
+            cached = _cache_get(cache_key)
+            if cached is not None:
+                return cached
+            
+            # Get the shared search client for this index
             try:
-                credential = AzureKeyCredential(search_key)
-                search_client = SearchClient(
-                    endpoint=search_endpoint,
-                    index_name=index_name,
-                    credential=credential
-                )
+                search_client = _get_search_client(search_endpoint, search_key, index_name)
             except Exception as init_error:
                 return f"Error initializing Azure Search client: {str(init_error)}. Please check your Azure Search credentials and endpoint configuration."
             
             # Perform search with timeout (30 seconds)
-            import time
-            start_time = time.time()
-            try:
-                results = search_client.search(
-                    search_text=query,
-                    top=top,
-                    include_total_count=True
-                )
+            with _OUTBOUND_SEM:
+                start_time = time.monotonic()
+                try:
+                    results = search_client.search(
+                        search_text=query,
+                        top=top,
+                        select=["title", "content"]
+                    )
                 
-                results_list = list(results)
-                elapsed_time = time.time() - start_time
+                    # Stop at top so the pager never fetches a further page
+                    results_list = list(islice(results, top))
+                    elapsed_time = time.monotonic() - start_time
                 
-                if elapsed_time > 30:
-                    return f"Search timeout after {elapsed_time:.1f} seconds. Please try a simpler query."
+                    if elapsed_time > 30:
+                        return f"Search timeout after {elapsed_time:.1f} seconds. Please try a simpler query."
                     
-            except Exception as search_error:
-                elapsed_time = time.time() - start_time
-                if elapsed_time > 30:
-                    return f"Search timeout after {elapsed_time:.1f} seconds: {str(search_error)}"
-                raise search_error
-            
-            # Format results
-            formatted_results = []
-            for result in results_list:
-                result_dict = dict(result)
-                title = result_dict.get('title', 'No title')
-                content = result_dict.get('content', 'No content available')[:500]
-                score = result_dict.get('@search.score', 'N/A')
-                
-                formatted_results.append(f"**Title:** {title}\n**Score:** {score}\n**Content:** {content}...\n")
-            
-            if formatted_results:
-                header = f"Searched audit methodology index ({index_name}) and found {len(formatted_results)} results for query '{query}':\n\n"
-                return header + "\n---\n".join(formatted_results)
+                except Exception as search_error:
+                    elapsed_time = time.monotonic() - start_time
+                    if elapsed_time > 30:
+                        return f"Search timeout after {elapsed_time:.1f} seconds: {str(search_error)}"
+                    raise search_error
+            
+            if not results_list:
+                formatted = f"No results found in audit methodology index ({index_name}) for query: '{query}'"
             else:
-                return f"No results found in audit methodology index ({index_name}) for query: '{query}'"
+                # Format results into one buffer; results are already Mappings
+                buf = io.StringIO()
+                buf.write(f"Searched audit methodology index ({index_name}) and found {len(results_list)} results for query '{query}':\n\n")
+                for i, result in enumerate(results_list):
+                    if i:
+                        buf.write("\n---\n")
+                    buf.write(f"**Title:** {result.get('title', 'No title')}\n")
+                    buf.write(f"**Score:** {result.get('@search.score', 'N/A')}\n")
+                    buf.write(f"**Content:** {result.get('content', 'No content available')[:500]}...\n")
+                formatted = buf.getvalue()
+            
+            _cache_put(cache_key, formatted)
+            return formatted
                 
         except Exception as e:
+            _reload_env_on_auth_failure(getattr(e, "status_code", None))
             return f"Error searching audit methodology index: {str(e)}"
 
+    async def _arun(self, query: str, top: int = 5) -> str:
+        """Async variant of _run; the blocking search runs in a worker thread."""
+        return await asyncio.to_thread(self._run, query, top)
+
+    async def batch_search(self, queries: List[str], top: int = 5, max_concurrency: int = 8) -> List[str]:
+        """Run several searches concurrently, returning results in input order."""
+        return await _gather_bounded(self._arun, queries, top, max_concurrency)
+
 
 class SerperSearchInput(BaseModel):
     """Input schema for SERPER search tool."""
@@ -180,11 +420,18 @@ class SerperSearchTool(BaseTool):
     def _run(self, query: str, num_results: int = 5) -> str:
         try:
             # Get SERPER API key from environment
-            api_key = os.getenv("SERPER_API_KEY")
+            if not SERPER_API_KEY:
+                _reload_env()
+            api_key = SERPER_API_KEY
             
             if not api_key:
                 return "Error: SERPER API key not configured in environment variables."
             
+            cache_key = ("serper", query, num_results)
+            cached = _cache_get(cache_key)
+            if cached is not None:
+                return cached
+            
             # SERPER API endpoint
             url = "https://google.serper.dev/search"
             
@@ -195,44 +442,105 @@ class SerperSearchTool(BaseTool):
             }
             
             headers = {
-                "X-API-KEY": api_key,
-                "Content-Type": "application/json"
+                "X-API-KEY": api_key
             }
             
-            # Make API request with 15 second timeout
-            response = requests.post(url, headers=headers, json=payload, timeout=15)
+            # Make API request over the pooled client, backing off on throttling/gateway errors
+            body = orjson.dumps(payload)
+            client = _get_serper_client()
+            for attempt in range(_SERPER_MAX_RETRIES + 1):
+                with _OUTBOUND_SEM:
+                    response = client.post(url, headers=headers, content=body)
+                if response.status_code not in _SERPER_RETRY_STATUSES or attempt == _SERPER_MAX_RETRIES:
+                    break
+                time.sleep(0.3 * 2 ** attempt)
             response.raise_for_status()
             
-            data = response.json()
-            
-            # Format results
-            formatted_results = []
+            data = orjson.loads(response.content)
             
-            # Process organic results
-            organic_results = data.get('organic', [])
-            for result in organic_results:
-                title = result.get('title', 'No title')
-                snippet = result.get('snippet', 'No description available')
-                link = result.get('link', 'No link')
+            formatted = self._format_results(query, data)
+            _cache_put(cache_key, formatted)
+            return formatted
                 
-                formatted_results.append(f"**Title:** {title}\n**URL:** {link}\n**Description:** {snippet}\n")
+        except httpx.TimeoutException:
+            return "Error: SERPER API request timed out after 15 seconds. Please try again with a simpler query."
+        except httpx.ConnectError:
+            return "Error: Unable to connect to SERPER API. Please check your internet connection."
+        except httpx.HTTPStatusError as e:
+            _reload_env_on_auth_failure(e.response.status_code)
+            return f"Error: SERPER API HTTP error: {str(e)}. Please check your SERPER_API_KEY."
+        except httpx.HTTPError as e:
+            return f"Error making SERPER API request: {str(e)}"
+        except Exception as e:
+            return f"Error with web search: {str(e)}"
+
+    async def _arun(self, query: str, num_results: int = 5) -> str:
+        """Async variant of _run so several searches can run concurrently."""
+        try:
+            if not SERPER_API_KEY:
+                _reload_env()
+            api_key = SERPER_API_KEY
             
-            if formatted_results:
-                return f"Found {len(formatted_results)} web results for query '{query}':\n\n" + "\n---\n".join(formatted_results)
-            else:
-                return f"No web results found for query: '{query}'"
-                
-        except requests.exceptions.Timeout:
+            if not api_key:
+                return "Error: SERPER API key not configured in environment variables."
+            
+            cache_key = ("serper", query, num_results)
+            cached = _cache_get(cache_key)
+            if cached is not None:
+                return cached
+            
+            payload = {
+                "q": query,
+                "num": num_results
+            }
+            
+            client, semaphore = _get_async_serper()
+            async with semaphore:
+                response = await client.post(
+                    "https://google.serper.dev/search",
+                    headers={"X-API-KEY": api_key},
+                    content=orjson.dumps(payload)
+                )
+            response.raise_for_status()
+            
+            formatted = self._format_results(query, orjson.loads(response.content))
+            _cache_put(cache_key, formatted)
+            return formatted
+            
+        except httpx.TimeoutException:
             return "Error: SERPER API request timed out after 15 seconds. Please try again with a simpler query."
-        except requests.exceptions.ConnectionError:
+        except httpx.ConnectError:
             return "Error: Unable to connect to SERPER API. Please check your internet connection."
-        except requests.exceptions.HTTPError as e:
+        except httpx.HTTPStatusError as e:
+            _reload_env_on_auth_failure(e.response.status_code)
             return f"Error: SERPER API HTTP error: {str(e)}. Please check your SERPER_API_KEY."
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             return f"Error making SERPER API request: {str(e)}"
         except Exception as e:
             return f"Error with web search: {str(e)}"
 
+    async def batch_search(self, queries: List[str], num_results: int = 5) -> List[str]:
+        """Run several searches concurrently, multiplexed over one HTTP/2 connection."""
+        return list(await asyncio.gather(*(self._arun(query, num_results) for query in queries)))
+
+    @staticmethod
+    def _format_results(query: str, data: dict) -> str:
+        """Format a SERPER response body into the tool's text output."""
+        # Process organic results
+        organic_results = data.get('organic', [])
+        if not organic_results:
+            return f"No web results found for query: '{query}'"
+        
+        buf = io.StringIO()
+        buf.write(f"Found {len(organic_results)} web results for query '{query}':\n\n")
+        for i, result in enumerate(organic_results):
+            if i:
+                buf.write("\n---\n")
+            buf.write(f"**Title:** {result.get('title', 'No title')}\n")
+            buf.write(f"**URL:** {result.get('link', 'No link')}\n")
+            buf.write(f"**Description:** {result.get('snippet', 'No description available')}\n")
+        return buf.getvalue()
+
 
 class DocumentTranslationInput(BaseModel):
     """Input schema for Document Translation tool."""
@@ -252,18 +560,17 @@ class DocumentTranslationTool(BaseTool):
     )
     args_schema: Type[BaseModel] = DocumentTranslationInput
 
-    def _get_content_type(self, file_path: str) -> str:
-        """Determine the appropriate MIME type based on file extension."""
-        file_extension = os.path.splitext(file_path)[1].lower()
-        
-        # Use the exact content types from the Azure documentation
-        content_type_mapping = {
-            ".pdf": "application/pdf",
-            ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            ".doc": "application/msword"
-        }
-        
-        return content_type_mapping.get(file_extension, "application/octet-stream")
+    # Use the exact content types from the Azure documentation
+    _CONTENT_TYPES: ClassVar[Mapping[str, str]] = MappingProxyType({
+        ".pdf": "application/pdf",
+        ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        ".doc": "application/msword"
+    })
+    _SUPPORTED_FORMATS: ClassVar[Tuple[str, ...]] = tuple(_CONTENT_TYPES)
+
+    def _get_content_type(self, file_extension: str) -> str:
+        """Determine the appropriate MIME type for a lower-cased file extension."""
+        return self._CONTENT_TYPES.get(file_extension, "application/octet-stream")
     
     def _run(self, file_path: str, target_language: str, source_language: str = "auto", output_file_path: str = "") -> str:
         # Check if this looks like a simple filename (not a full path)
@@ -271,17 +578,18 @@ class DocumentTranslationTool(BaseTool):
             # Use the simplified translation helper for filename-only requests
             try:
                 # Import here to avoid circular import
-                from .simple_translation import SimpleTranslationHelper
-                simple_helper = SimpleTranslationHelper()
-                return simple_helper.translate_document(file_path, target_language, source_language)
+                from .simple_translation import translate_document
+                return translate_document(file_path, target_language, source_language)
             except Exception as e:
                 # Fall back to original logic if helper fails
                 pass
         
         try:
-            # Get Azure Document Translation configuration from environment
-            endpoint = os.getenv("AZURE_DOCUMENT_TRANSLATION_ENDPOINT")
-            key = os.getenv("AZURE_DOCUMENT_TRANSLATION_KEY")
+            # Pick up configuration set after import before reporting it missing
+            if not AZURE_DOCUMENT_TRANSLATION_ENDPOINT or not AZURE_DOCUMENT_TRANSLATION_KEY:
+                _reload_env()
+            endpoint = AZURE_DOCUMENT_TRANSLATION_ENDPOINT
+            key = AZURE_DOCUMENT_TRANSLATION_KEY
             
             if not endpoint or not key:
                 return "Error: Azure Document Translation credentials not configured. Please check AZURE_DOCUMENT_TRANSLATION_ENDPOINT and AZURE_DOCUMENT_TRANSLATION_KEY in environment variables."
@@ -291,62 +599,67 @@ class DocumentTranslationTool(BaseTool):
                 # If relative path, assume it's relative to current working directory
                 file_path = os.path.abspath(file_path)
             
-            # Check if input file exists
-            if not os.path.exists(file_path):
+            # Check if input file exists; one stat also gives the size logged below
+            try:
+                file_stat = os.stat(file_path)
+            except (FileNotFoundError, NotADirectoryError):
                 return f"Error: Document file not found at path: {file_path}"
             
-            # Validate file format
-            file_extension = os.path.splitext(file_path)[1].lower()
-            supported_formats = [".pdf", ".docx", ".doc"]
+            # Validate file format with a suffix compare instead of splitting the path
+            file_path_lower = file_path.lower()
+            file_extension = next((e for e in self._SUPPORTED_FORMATS if file_path_lower.endswith(e)), None)
             
-            if file_extension not in supported_formats:
-                return f"Error: Unsupported file format '{file_extension}'. Supported formats: {', '.join(supported_formats)}"
+            if file_extension is None:
+                file_extension = os.path.splitext(file_path_lower)[1]
+                return f"Error: Unsupported file format '{file_extension}'. Supported formats: {', '.join(self._SUPPORTED_FORMATS)}"
             
             # Determine output file path if not provided
             if not output_file_path:
-                base_name, ext = os.path.splitext(file_path)
-                output_file_path = f"{base_name}_{target_language}{ext}"
+                split_at = len(file_path) - len(file_extension)
+                output_file_path = f"{file_path[:split_at]}_{target_language}{file_path[split_at:]}"
             
-            # Initialize the translation client
-            client = SingleDocumentTranslationClient(endpoint, AzureKeyCredential(key))
+            # Get the shared translation client
+            client = _get_translation_client(endpoint, key)
+            from azure.ai.translation.document.models import DocumentTranslateContent
             
-            # Read the document file
-            with open(file_path, 'rb') as file:
-                file_contents = file.read()
-                file_name = os.path.basename(file_path)
+            file_name = os.path.basename(file_path)
             
-            print(f"File size: {len(file_contents)} bytes")
-            print(f"File name: {file_name}")
+            logger.debug("File size: %d bytes", file_stat.st_size)
+            logger.debug("File name: %s", file_name)
             
             # Get the appropriate content type for the file
-            content_type = self._get_content_type(file_path)
-            
-            # Create document translate content
-            document_translate_content = DocumentTranslateContent(
-                document=(file_name, file_contents, content_type)
-            )
-            
-            # Perform translation
-            print(f"Translating {file_name} from {source_language} to {target_language}...")
+            content_type = self._get_content_type(file_extension)
             
-            # Call translate method with proper parameters
-            # Don't include source_language if it's 'auto' for PDFs as it may cause issues
-            translate_params = {
-                "body": document_translate_content,
-                "target_language": target_language
-            }
-            
-            # Only add source language if it's not 'auto' and not PDF
-            if source_language != "auto":
-                translate_params["source_language"] = source_language
-            
-            response = client.translate(**translate_params)
+            # Pass the open file to the SDK so the upload streams from disk
+            # instead of holding the whole document in memory first
+            with open(file_path, 'rb') as file:
+                # Create document translate content
+                document_translate_content = DocumentTranslateContent(
+                    document=(file_name, file, content_type)
+                )
+                
+                # Perform translation
+                logger.debug("Translating %s from %s to %s...", file_name, source_language, target_language)
+                
+                # Call translate method with proper parameters
+                # Don't include source_language if it's 'auto' for PDFs as it may cause issues
+                translate_params = {
+                    "body": document_translate_content,
+                    "target_language": target_language
+                }
+                
+                # Only add source language if it's not 'auto' and not PDF
+                if source_language != "auto":
+                    translate_params["source_language"] = source_language
+                
+                with _OUTBOUND_SEM:
+                    response = client.translate(**translate_params)
             
             # Save translated document
             with open(output_file_path, 'wb') as output_file:
                 output_file.write(response)
             
-            file_size = os.path.getsize(output_file_path)
+            file_size = len(response)
             file_type = "PDF" if file_extension == ".pdf" else "DOCX document"
             return f"Successfully translated {file_type} from {source_language} to {target_language}. Output saved to: {output_file_path} ({file_size} bytes)"
             
@@ -355,104 +668,101 @@ class DocumentTranslationTool(BaseTool):
         except PermissionError:
             return f"Error: Permission denied when accessing file {file_path} or writing to {output_file_path}"
         except Exception as e:
+            _reload_env_on_auth_failure(getattr(e, "status_code", None))
             return f"Error translating document: {str(e)}"
 
+    async def _arun(self, file_path: str, target_language: str, source_language: str = "auto", output_file_path: str = "") -> str:
+        """Async variant of _run; the blocking SDK call runs in a worker thread."""
+        return await asyncio.to_thread(self._run, file_path, target_language, source_language, output_file_path)
+
+    async def translate_batch(self, file_paths: List[str], target_language: str, source_language: str = "auto", max_concurrency: int = 8) -> List[str]:
+        """Translate several documents concurrently, returning one result message per path."""
+        # Keep concurrency below the Translator service's request limit
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def translate_one(file_path: str) -> str:
+            async with semaphore:
+                return await self._arun(file_path, target_language, source_language)
+
+        return list(await asyncio.gather(*(translate_one(file_path) for file_path in file_paths)))
+
 
 # Export tool classes for lazy instantiation
 # This prevents import-time errors if environment variables are missing
 
 # For backward compatibility, provide lazy-loaded instances
+@lru_cache(maxsize=None)
 def get_echo_search_tool():
-    """Get Echo Search tool instance with lazy loading."""
+    """Get the shared Echo Search tool instance, created on first use."""
     return EchoSearchTool()
 
+@lru_cache(maxsize=None)
 def get_audit_search_tool():
-    """Get Audit Search tool instance with lazy loading."""
+    """Get the shared Audit Search tool instance, created on first use."""
     return AuditSearchTool()
 
+@lru_cache(maxsize=None)
 def get_serper_search_tool():
-    """Get SERPER search tool instance with lazy loading."""
+    """Get the shared SERPER search tool instance, created on first use."""
     return SerperSearchTool()
 
+@lru_cache(maxsize=None)
 def get_document_translation_tool():
-    """Get document translation tool instance with lazy loading."""
+    """Get the shared document translation tool instance, created on first use."""
     return DocumentTranslationTool()
 
 # Keep legacy global instances for backward compatibility
-# These will be instantiated on first access, not at import time
-echo_search_tool = None
-audit_search_tool = None
-serper_search_tool = None
-document_translation_tool = None
-pdf_translation_tool = None
+# These are resolved through __getattr__ on first access, not at import time
+_LEGACY_TOOLS = {
+    "echo_search_tool": get_echo_search_tool,
+    "audit_search_tool": get_audit_search_tool,
+    "serper_search_tool": get_serper_search_tool,
+    "document_translation_tool": get_document_translation_tool,
+    "pdf_translation_tool": get_document_translation_tool,
+}
+
+def __getattr__(name):
+    getter = _LEGACY_TOOLS.get(name)
+    if getter is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getter()
 
 def validate_environment_variables():
     """Validate that required environment variables are properly formatted."""
+    return list(_environment_issues())
+
+# (variable, required prefix, minimum length) checked by validate_environment_variables
+_ENV_CHECKS: Tuple[Tuple[str, Optional[str], Optional[int]], ...] = (
+    # Azure OpenAI
+    ("AZURE_API_KEY", None, 10),
+    # Azure Search
+    ("AzureSearchEnpoint", "https://", None),
+    ("AzureSearchAdminKey", None, 10),
+    # Azure Document Translation
+    ("AZURE_DOCUMENT_TRANSLATION_ENDPOINT", "https://", None),
+    ("AZURE_DOCUMENT_TRANSLATION_KEY", None, 20),
+)
+
+@lru_cache(maxsize=1)
+def _environment_issues():
+    """Formatting problems in the environment; computed once per process (cache_clear() to recheck)."""
     issues = []
-    
-    # Check Azure OpenAI variables
-    azure_api_key = os.getenv("AZURE_API_KEY")
-    if azure_api_key and len(azure_api_key) < 10:
-        issues.append("AZURE_API_KEY seems too short")
-    
-    # Check Azure Search variables
-    search_endpoint = os.getenv("AzureSearchEnpoint")
-    if search_endpoint and not search_endpoint.startswith("https://"):
-        issues.append("AzureSearchEnpoint should start with https://")
-    
-    search_key = os.getenv("AzureSearchAdminKey")
-    if search_key and len(search_key) < 10:
-        issues.append("AzureSearchAdminKey seems too short")
-    
-    # Check Azure Document Translation variables
-    doc_endpoint = os.getenv("AZURE_DOCUMENT_TRANSLATION_ENDPOINT")
-    if doc_endpoint and not doc_endpoint.startswith("https://"):
-        issues.append("AZURE_DOCUMENT_TRANSLATION_ENDPOINT should start with https://")
-    
-    doc_key = os.getenv("AZURE_DOCUMENT_TRANSLATION_KEY")
-    if doc_key and len(doc_key) < 20:
-        issues.append("AZURE_DOCUMENT_TRANSLATION_KEY seems too short")
-    
-    return issues
+    env = os.environ
+    for name, prefix, min_length in _ENV_CHECKS:
+        value = env.get(name)
+        if not value:
+            continue
+        if prefix and not value.startswith(prefix):
+            issues.append(f"{name} should start with {prefix}")
+        if min_length and len(value) < min_length:
+            issues.append(f"{name} seems too short")
+    return tuple(issues)
 
-def _ensure_tools_loaded():
-    """Ensure tool instances are loaded with proper error handling."""
-    global echo_search_tool, audit_search_tool, serper_search_tool, document_translation_tool, pdf_translation_tool
-    
-    try:
-        # Validate environment variables first
-        env_issues = validate_environment_variables()
-        if env_issues:
-            print(f"Environment validation warnings: {', '.join(env_issues)}")
-        
-        if echo_search_tool is None:
-            echo_search_tool = EchoSearchTool()
-        if audit_search_tool is None:
-            audit_search_tool = AuditSearchTool()
-        if serper_search_tool is None:
-            serper_search_tool = SerperSearchTool()
-        if document_translation_tool is None:
-            document_translation_tool = DocumentTranslationTool()
-        if pdf_translation_tool is None:
-            pdf_translation_tool = document_translation_tool
-            
-    except Exception as e:
-        print(f"Warning: Tool initialization error: {e}")
-        # Don't fail completely, just log the error
-        if echo_search_tool is None:
-            echo_search_tool = EchoSearchTool()
-        if audit_search_tool is None:
-            audit_search_tool = AuditSearchTool()
-        if serper_search_tool is None:
-            serper_search_tool = SerperSearchTool()
-        if document_translation_tool is None:
-            document_translation_tool = DocumentTranslationTool()
-        if pdf_translation_tool is None:
-            pdf_translation_tool = document_translation_tool
-
-# Auto-load tools when module is accessed (with error handling)
-try:
-    _ensure_tools_loaded()
-except Exception as startup_error:
-    print(f"Startup warning: {startup_error}")
-    # Continue anyway - tools will be loaded on demand
+def _warn_environment_issues():
+    """Print a warning listing any malformed environment variables."""
+    env_issues = validate_environment_variables()
+    if env_issues:
+        print(f"Environment validation warnings: {', '.join(env_issues)}")
+
+# Report environment problems at import; tools are created on first use
+_warn_environment_issues()
@@ -1,134 +1,188 @@
 import os
+import stat
+import time
 import platform
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Dict, Union
 import re
 
+# Document types that can be translated
+_SUPPORTED_EXTENSIONS = frozenset({'.pdf', '.docx', '.doc'})
+# Same extensions as a tuple for str.endswith
+_SUPPORTED_EXT_TUPLE = tuple(_SUPPORTED_EXTENSIONS)
+
+@dataclass(frozen=True, slots=True)
+class FoundFile:
+    """
+    A file located through a directory listing.
+    is_file carries the file type scandir already reported, so validation
+    does not need to stat the file again.
+    """
+    path: Path
+    is_file: bool = True
+
 class CrossPlatformDocumentsHelper:
     """
     Cross-platform helper for finding and managing documents in the Documents folder.
     Works seamlessly on Mac, Windows, and Linux systems.
     """
     
+    # Seconds a resolved Documents folder is reused before searching again
+    FOLDER_CACHE_TTL = 5.0
+    
     def __init__(self):
         self.system = platform.system().lower()
-        self.supported_extensions = {'.pdf', '.docx', '.doc'}
+        self.supported_extensions = _SUPPORTED_EXTENSIONS
+        # Platform-specific candidate builder, chosen once since the platform never changes
+        self._platform_candidates = {
+            "windows": self._windows_candidates,
+            "darwin": self._macos_candidates,
+            "linux": self._linux_candidates,
+        }.get(self.system, self._no_candidates)
+        # Last resolved Documents folder and when it was resolved (monotonic seconds)
+        self._cached_docs_folder: Optional[Path] = None
+        self._cache_ts = 0.0
+        # Directory listings keyed by path, reused while the directory's mtime is unchanged
+        self._listing_cache: Dict[str, Tuple[int, List[Tuple[str, str, str]]]] = {}
     
     def get_documents_folders(self) -> List[Path]:
         """
         Get potential Documents folder locations in priority order.
         Returns list of Path objects to check.
         """
+        # Candidates are built as plain strings and only become Path objects on return
+        join = os.path.join
         candidates = []
         
         # 1. Environment variable override (highest priority)
         env_path = os.getenv("DOCUMENTS_FOLDER_PATH")
         if env_path:
-            candidates.append(Path(env_path))
+            candidates.append(env_path)
         
         # 2. Project-local Documents folder (current working directory)
-        try:
-            cwd = Path.cwd()
-            project_docs = cwd / "Documents"
-            candidates.append(project_docs)
-        except Exception:
-            pass
-        
         # 3. Parent directory Documents folder (in case we're in a subdirectory)
         try:
-            cwd = Path.cwd()
-            parent_docs = cwd.parent / "Documents"
-            candidates.append(parent_docs)
+            cwd = os.getcwd()
+            candidates.append(join(cwd, "Documents"))
+            candidates.append(join(os.path.dirname(cwd), "Documents"))
         except Exception:
             pass
         
         # 4. Standard user Documents folder (cross-platform)
-        try:
-            user_home = Path.home()
-            standard_docs = user_home / "Documents"
-            candidates.append(standard_docs)
-        except Exception:
-            pass
+        user_home = os.path.expanduser("~")
+        candidates.append(join(user_home, "Documents"))
         
         # 5. Platform-specific additional locations
-        if self.system == "windows":
-            # Windows specific paths
-            try:
-                # OneDrive Documents (common on Windows)
-                user_home = Path.home()
-                onedrive_docs = user_home / "OneDrive" / "Documents"
-                candidates.append(onedrive_docs)
-                
-                # Legacy Windows path structure
-                username = os.getenv("USERNAME")
-                if username:
-                    legacy_path = Path(f"C:/Users/{username}/Documents")
-                    candidates.append(legacy_path)
-            except Exception:
-                pass
-                
-        elif self.system == "darwin":  # macOS
-            # macOS specific paths
-            try:
-                user_home = Path.home()
-                # iCloud Documents (if synced)
-                icloud_docs = user_home / "Library" / "Mobile Documents" / "com~apple~CloudDocs" / "Documents"
-                candidates.append(icloud_docs)
-                
-                # Legacy macOS path
-                username = os.getenv("USER")
-                if username:
-                    legacy_path = Path(f"/Users/{username}/Documents")
-                    candidates.append(legacy_path)
-            except Exception:
-                pass
-        
-        # 6. Linux/Unix fallbacks
-        elif self.system == "linux":
-            try:
-                # XDG user directories
-                xdg_docs = Path.home() / "Documents"
-                candidates.append(xdg_docs)
-                
-                username = os.getenv("USER")
-                if username:
-                    legacy_path = Path(f"/home/{username}/Documents")
-                    candidates.append(legacy_path)
-            except Exception:
-                pass
-        
-        # Remove duplicates while preserving order
+        candidates.extend(self._platform_candidates(user_home))
+        
+        # Remove duplicates while preserving order. Compare canonical paths so that
+        # symlinked or legacy spellings of the same folder are only checked once;
+        # realpath is skipped when the parent is missing since nothing there resolves
         unique_candidates = []
         seen = set()
-        for path in candidates:
-            if path not in seen:
-                unique_candidates.append(path)
-                seen.add(path)
+        for raw in candidates:
+            if os.path.isdir(os.path.dirname(raw)):
+                key = os.path.normcase(os.path.realpath(raw))
+            else:
+                key = os.path.normcase(os.path.abspath(raw))
+            if key not in seen:
+                unique_candidates.append(Path(raw))
+                seen.add(key)
         
         return unique_candidates
     
+    def _windows_candidates(self, user_home: str) -> List[str]:
+        """Windows specific paths."""
+        # OneDrive Documents (common on Windows)
+        candidates = [os.path.join(user_home, "OneDrive", "Documents")]
+        
+        # Legacy Windows path structure
+        username = os.getenv("USERNAME")
+        if username:
+            candidates.append(f"C:/Users/{username}/Documents")
+        return candidates
+    
+    def _macos_candidates(self, user_home: str) -> List[str]:
+        """macOS specific paths."""
+        # iCloud Documents (if synced)
+        candidates = [os.path.join(user_home, "Library", "Mobile Documents", "com~apple~CloudDocs", "Documents")]
+        
+        # Legacy macOS path
+        username = os.getenv("USER")
+        if username:
+            candidates.append(f"/Users/{username}/Documents")
+        return candidates
+    
+    def _linux_candidates(self, user_home: str) -> List[str]:
+        """Linux/Unix fallbacks."""
+        # XDG user directories resolve to ~/Documents, already listed by the caller
+        username = os.getenv("USER")
+        return [f"/home/{username}/Documents"] if username else []
+    
+    def _no_candidates(self, user_home: str) -> List[str]:
+        """Other platforms only use the common locations."""
+        return []
+    
     def find_documents_folder(self) -> Optional[Path]:
         """
         Find the first existing and accessible Documents folder.
         Returns None if no valid Documents folder is found.
+        The result is reused for a few seconds while the folder still exists.
         """
+        cached = self._cached_docs_folder
+        if (cached is not None and time.monotonic() - self._cache_ts < self.FOLDER_CACHE_TTL
+                and os.path.isdir(cached)):
+            return cached
+        
         candidates = self.get_documents_folders()
         
+        # Most candidates live under the home folder; one listing of it rules out
+        # the ones whose top-level folder is missing without a stat each
+        home = os.path.expanduser("~")
+        home_prefix = os.path.join(home, "")
+        home_names = None
+        
         for folder in candidates:
+            raw = str(folder)
+            if raw.startswith(home_prefix):
+                if home_names is None:
+                    home_names = self._list_names_lower(home)
+                top = raw[len(home_prefix):].split(os.sep, 1)[0]
+                if home_names and top.lower() not in home_names:
+                    continue
             if self._is_valid_documents_folder(folder):
+                self._cached_docs_folder = folder
+                self._cache_ts = time.monotonic()
                 return folder
         
+        self.invalidate_cache()
         return None
     
+    def invalidate_cache(self) -> None:
+        """Forget the cached Documents folder and directory listings so the next lookup searches again."""
+        self._cached_docs_folder = None
+        self._cache_ts = 0.0
+        self._listing_cache.clear()
+    
+    def _list_names_lower(self, directory: str) -> frozenset:
+        """
+        Lower-cased names of all entries in a directory, or an empty set if it
+        cannot be read. Lower-casing can only let an extra candidate through to
+        the stat check on case-sensitive systems, never hide a real one.
+        """
+        try:
+            with os.scandir(directory) as entries:
+                return frozenset(entry.name.lower() for entry in entries)
+        except OSError:
+            return frozenset()
+    
     def _is_valid_documents_folder(self, path: Path) -> bool:
         """Check if a path is a valid, accessible Documents folder."""
         try:
-            return (
-                path.exists() and 
-                path.is_dir() and 
-                os.access(path, os.R_OK)
-            )
-        except (OSError, PermissionError):
+            # One stat answers both "exists" and "is a directory"
+            return stat.S_ISDIR(os.stat(path).st_mode) and os.access(path, os.R_OK)
+        except (OSError, ValueError):
             return False
     
     def find_file(self, filename: str, documents_folder: Optional[Path] = None) -> Optional[Path]:
@@ -142,6 +196,14 @@ class CrossPlatformDocumentsHelper:
         Returns:
             Path to the found file, or None if not found
         """
+        found = self.find_file_entry(filename, documents_folder)
+        return found.path if found else None
+    
+    def find_file_entry(self, filename: str, documents_folder: Optional[Path] = None) -> Optional[FoundFile]:
+        """
+        Same search as find_file, but keeps what the directory listing already
+        knows about the file so validate_file_access can skip its stat.
+        """
         if documents_folder is None:
             documents_folder = self.find_documents_folder()
         
@@ -150,103 +212,89 @@ class CrossPlatformDocumentsHelper:
         
         return self._search_file_in_directory(filename, documents_folder)
     
-    def _search_file_in_directory(self, filename: str, directory: Path) -> Optional[Path]:
+    def _search_file_in_directory(self, filename: str, directory: Path) -> Optional[FoundFile]:
         """
         Search for a file in the given directory with case-insensitive matching.
         Supports partial matches and automatic extension detection.
         """
-        if not directory.exists() or not directory.is_dir():
-            return None
-        
         # Normalize the search filename
         search_name = filename.lower()
         
         try:
-            # Get all files in the directory
-            for file_path in directory.iterdir():
-                if not file_path.is_file():
-                    continue
-                
-                file_name = file_path.name.lower()
-                
-                # Exact match (case-insensitive)
-                if file_name == search_name:
-                    return file_path
-                
-                # Match with automatic extension detection
-                if self._matches_with_extension(search_name, file_name):
-                    return file_path
-            
-            # If no exact match, try partial matching
-            return self._find_partial_match(search_name, directory)
-            
+            files = self._list_files(directory)
         except (PermissionError, OSError):
             return None
+        
+        # Exact match (case-insensitive) or match with automatic extension detection,
+        # precomputed so each listed file costs one set lookup
+        targets = self._candidate_names(search_name)
+        for _, file_name, path in files:
+            if file_name in targets:
+                return FoundFile(Path(path))
+        
+        # If no exact match, try partial matching against the same listing
+        partial = self._find_partial_match(search_name, files)
+        return FoundFile(partial) if partial else None
     
-    def _matches_with_extension(self, search_name: str, file_name: str) -> bool:
-        """Check if search name matches file name when considering extensions."""
-        # If search name has no extension, try adding supported extensions
-        if '.' not in search_name:
-            for ext in self.supported_extensions:
-                if file_name == search_name + ext:
-                    return True
-        
-        # If search name has extension, check if file has supported extension
-        if '.' in search_name:
-            search_base = search_name.rsplit('.', 1)[0]
-            file_base = file_name.rsplit('.', 1)[0] if '.' in file_name else file_name
-            file_ext = '.' + file_name.rsplit('.', 1)[1] if '.' in file_name else ''
-            
-            return (search_base == file_base and 
-                   file_ext in self.supported_extensions)
+    def _list_files(self, directory: Path) -> List[Tuple[str, str, str]]:
+        """
+        List the regular files in a directory in one scandir pass.
+        DirEntry.is_file() reuses the file type readdir already returned instead of
+        stat-ing every entry. The listing is reused while the directory's mtime is
+        unchanged, so repeat lookups cost a single stat.
         
-        return False
+        Returns:
+            List of tuples: (filename, lower-cased filename, full path)
+        """
+        key = os.fspath(directory)
+        mtime = os.stat(key).st_mtime_ns
+        cached = self._listing_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        with os.scandir(key) as entries:
+            files = [(entry.name, entry.name.lower(), entry.path) for entry in entries if entry.is_file()]
+        self._listing_cache[key] = (mtime, files)
+        return files
     
-    def _find_partial_match(self, search_name: str, directory: Path) -> Optional[Path]:
-        """Find partial matches if exact match fails."""
-        try:
-            # Remove extension from search name for partial matching
-            search_base = search_name.rsplit('.', 1)[0] if '.' in search_name else search_name
-            
-            best_match = None
-            best_score = 0
-            
-            for file_path in directory.iterdir():
-                if not file_path.is_file():
-                    continue
-                
-                file_name = file_path.name.lower()
-                file_ext = '.' + file_name.rsplit('.', 1)[1] if '.' in file_name else ''
-                
-                # Only consider supported file types
-                if file_ext not in self.supported_extensions:
-                    continue
-                
-                file_base = file_name.rsplit('.', 1)[0] if '.' in file_name else file_name
-                
-                # Calculate similarity score
-                if search_base in file_base or file_base in search_base:
-                    # Simple scoring: longer common substring gets higher score
-                    score = len(self._longest_common_substring(search_base, file_base))
-                    if score > best_score:
-                        best_score = score
-                        best_match = file_path
+    def _candidate_names(self, search_name: str) -> frozenset:
+        """
+        Lower-cased file names that count as a direct match for search_name: the
+        name itself, plus its base name with each supported extension (a search
+        without an extension gets one added, one with an extension may name the
+        wrong supported type).
+        """
+        dot = search_name.rfind('.')
+        search_base = search_name[:dot] if dot >= 0 else search_name
+        return frozenset({search_name, *(search_base + ext for ext in self.supported_extensions)})
+    
+    def _find_partial_match(self, search_name: str, files: List[Tuple[str, str, str]]) -> Optional[Path]:
+        """Find partial matches among listed files if exact match fails."""
+        # Remove extension from search name for partial matching
+        dot = search_name.rfind('.')
+        search_base = search_name[:dot] if dot >= 0 else search_name
+        
+        best_match = None
+        best_score = 0
+        
+        for _, file_name, path in files:
+            # Only consider supported file types
+            if not file_name.endswith(_SUPPORTED_EXT_TUPLE):
+                continue
             
-            # Only return match if it's reasonably good (at least 3 characters match)
-            return best_match if best_score >= 3 else None
+            file_base = file_name[:file_name.rfind('.')]
             
-        except (PermissionError, OSError):
-            return None
-    
-    def _longest_common_substring(self, str1: str, str2: str) -> str:
-        """Find the longest common substring between two strings."""
-        longest = ""
-        for i in range(len(str1)):
-            for j in range(i + 1, len(str1) + 1):
-                substr = str1[i:j]
-                if substr in str2 and len(substr) > len(longest):
-                    longest = substr
-        return longest
+            # Calculate similarity score
+            if search_base in file_base or file_base in search_base:
+                # Simple scoring: longer common substring gets higher score. One name
+                # contains the other, so that substring is the shorter name itself
+                score = min(len(search_base), len(file_base))
+                if score > best_score:
+                    best_score = score
+                    best_match = path
+        
+        # Only return match if it's reasonably good (at least 3 characters match)
+        return Path(best_match) if best_score >= 3 else None
     
     def list_supported_files(self, documents_folder: Optional[Path] = None) -> List[Tuple[str, Path]]:
         """
@@ -258,32 +306,43 @@ class CrossPlatformDocumentsHelper:
         if documents_folder is None:
             documents_folder = self.find_documents_folder()
         
-        if not documents_folder or not documents_folder.exists():
+        if not documents_folder:
             return []
         
         supported_files = []
         
         try:
-            for file_path in documents_folder.iterdir():
-                if (file_path.is_file() and 
-                    file_path.suffix.lower() in self.supported_extensions):
-                    supported_files.append((file_path.name, file_path))
+            for name, name_lower, path in self._list_files(documents_folder):
+                # Same rule as Path.suffix: a leading dot alone is not an extension
+                dot = name_lower.rfind('.')
+                if dot > 0 and name_lower[dot:] in self.supported_extensions:
+                    supported_files.append((name, Path(path)))
         except (PermissionError, OSError):
             pass
         
         return sorted(supported_files, key=lambda x: x[0].lower())
     
-    def validate_file_access(self, file_path: Path) -> Tuple[bool, str]:
+    def validate_file_access(self, file_path: Union[FoundFile, Path]) -> Tuple[bool, str]:
         """
         Validate that a file exists and is accessible.
+        A FoundFile from find_file_entry reuses the listing's file type instead of stat-ing.
         
         Returns:
             Tuple of (is_valid, error_message)
         """
-        if not file_path.exists():
-            return False, f"File not found: {file_path}"
+        if isinstance(file_path, FoundFile):
+            is_file = file_path.is_file
+            file_path = file_path.path
+        else:
+            # One stat answers both "exists" and "is a regular file"
+            try:
+                is_file = stat.S_ISREG(os.stat(file_path).st_mode)
+            except FileNotFoundError:
+                return False, f"File not found: {file_path}"
+            except OSError as e:
+                return False, f"Cannot access file: {e}"
         
-        if not file_path.is_file():
+        if not is_file:
             return False, f"Path is not a file: {file_path}"
         
         if file_path.suffix.lower() not in self.supported_extensions:
@@ -319,7 +378,8 @@ class CrossPlatformDocumentsHelper:
             "system": platform.system(),
             "platform": platform.platform(),
             "documents_folder": str(docs_folder) if docs_folder else None,
-            "documents_folder_exists": docs_folder.exists() if docs_folder else False,
+            # find_documents_folder only returns folders it just checked exist
+            "documents_folder_exists": docs_folder is not None,
             "searched_paths": [str(p) for p in candidates],
             "user_home": str(Path.home()),
             "supported_extensions": list(self.supported_extensions)
@@ -1,8 +1,73 @@
 import re
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional, Tuple, Dict
 from pathlib import Path
 from .documents_helper import CrossPlatformDocumentsHelper
 
+# Translation request patterns, most specific first:
+# "translate [filename] from [source] to [target]"
+_PAT_FROM_TO = re.compile(r'translate\s+(\S+)\s+from\s+(\S+)\s+to\s+(\S+)', re.IGNORECASE)
+# "translate [filename] to [language]"
+_PAT_TRANSLATE_TO = re.compile(r'translate\s+(\S+)\s+to\s+(\S+)', re.IGNORECASE)
+# "[filename] to [language]"
+_PAT_TO = re.compile(r'(\S+)\s+to\s+(\S+)', re.IGNORECASE)
+
+# Common language names to ISO codes (read-only, shared by every helper)
+_LANGUAGE_CODES = MappingProxyType({
+    'spanish': 'es',
+    'french': 'fr',
+    'german': 'de',
+    'italian': 'it',
+    'portuguese': 'pt',
+    'chinese': 'zh',
+    'japanese': 'ja',
+    'korean': 'ko',
+    'russian': 'ru',
+    'arabic': 'ar',
+    'hindi': 'hi',
+    'dutch': 'nl',
+    'swedish': 'sv',
+    'norwegian': 'no',
+    'danish': 'da',
+    'finnish': 'fi',
+    'polish': 'pl',
+    'czech': 'cs',
+    'hungarian': 'hu',
+    'greek': 'el',
+    'turkish': 'tr',
+    'hebrew': 'he',
+    'thai': 'th',
+    'vietnamese': 'vi',
+    'indonesian': 'id',
+    'malay': 'ms',
+    'tagalog': 'tl',
+    'ukrainian': 'uk',
+    'bulgarian': 'bg',
+    'romanian': 'ro',
+    'croatian': 'hr',
+    'serbian': 'sr',
+    'slovak': 'sk',
+    'slovenian': 'sl',
+    'lithuanian': 'lt',
+    'latvian': 'lv',
+    'estonian': 'et'
+})
+
+
+@lru_cache(maxsize=128)
+def _normalize_language_code(language: str) -> Optional[str]:
+    """Convert language name or code to standard ISO code."""
+    lang_lower = language.lower().strip()
+    
+    # If it's already a valid language code (2-3 letters)
+    if len(lang_lower) in [2, 3] and lang_lower.isalpha():
+        return lang_lower
+    
+    # Look up in language names mapping
+    return _LANGUAGE_CODES.get(lang_lower)
+
+
 class SimpleTranslationHelper:
     """
     Simplified interface for document translation that automatically finds files in Documents folder.
@@ -14,46 +79,7 @@ class SimpleTranslationHelper:
         self.translation_tool = None  # Will be initialized when needed
         
         # Language code mapping for common language names
-        self.language_codes = {
-            # Common language names to ISO codes
-            'spanish': 'es',
-            'french': 'fr',
-            'german': 'de',
-            'italian': 'it',
-            'portuguese': 'pt',
-            'chinese': 'zh',
-            'japanese': 'ja',
-            'korean': 'ko',
-            'russian': 'ru',
-            'arabic': 'ar',
-            'hindi': 'hi',
-            'dutch': 'nl',
-            'swedish': 'sv',
-            'norwegian': 'no',
-            'danish': 'da',
-            'finnish': 'fi',
-            'polish': 'pl',
-            'czech': 'cs',
-            'hungarian': 'hu',
-            'greek': 'el',
-            'turkish': 'tr',
-            'hebrew': 'he',
-            'thai': 'th',
-            'vietnamese': 'vi',
-            'indonesian': 'id',
-            'malay': 'ms',
-            'tagalog': 'tl',
-            'ukrainian': 'uk',
-            'bulgarian': 'bg',
-            'romanian': 'ro',
-            'croatian': 'hr',
-            'serbian': 'sr',
-            'slovak': 'sk',
-            'slovenian': 'sl',
-            'lithuanian': 'lt',
-            'latvian': 'lv',
-            'estonian': 'et'
-        }
+        self.language_codes = _LANGUAGE_CODES
     
     def translate_document(self, filename: str, target_language: str, source_language: str = "auto") -> str:
         """
@@ -67,19 +93,21 @@ class SimpleTranslationHelper:
         Returns:
             String result message indicating success or failure with details
         """
+        helper = self.docs_helper
         try:
             # Step 1: Find Documents folder
-            docs_folder = self.docs_helper.find_documents_folder()
+            docs_folder = helper.find_documents_folder()
             if not docs_folder:
                 return self._format_error("Cannot find Documents folder", self._get_documents_search_info())
             
             # Step 2: Find the file
-            file_path = self.docs_helper.find_file(filename, docs_folder)
-            if not file_path:
+            found = helper.find_file_entry(filename, docs_folder)
+            if not found:
                 return self._format_file_not_found_error(filename, docs_folder)
+            file_path = found.path
             
-            # Step 3: Validate file access
-            is_valid, error_msg = self.docs_helper.validate_file_access(file_path)
+            # Step 3: Validate file access (reuses what the directory listing found)
+            is_valid, error_msg = helper.validate_file_access(found)
             if not is_valid:
                 return self._format_error("File validation failed", error_msg)
             
@@ -90,7 +118,7 @@ class SimpleTranslationHelper:
                                         f"'{target_language}' is not recognized. Use language codes (es, fr, de) or names (spanish, french, german)")
             
             # Step 5: Generate output path
-            output_path = self.docs_helper.get_suggested_output_path(file_path, target_lang_code)
+            output_path = helper.get_suggested_output_path(file_path, target_lang_code)
             
             # Step 6: Perform translation using the existing tool
             if self.translation_tool is None:
@@ -124,31 +152,14 @@ class SimpleTranslationHelper:
         Returns:
             Tuple of (filename, target_language, source_language) or None if parsing fails
         """
-        query_lower = user_query.lower().strip()
-        
-        # Pattern 1: "translate [filename] to [language]"
-        pattern1 = r'translate\s+([^\s]+(?:\.[^\s]+)?)\s+to\s+([^\s]+)'
-        match1 = re.search(pattern1, query_lower)
-        if match1:
-            filename = match1.group(1)
-            target_lang = match1.group(2)
-            return filename, target_lang, "auto"
-        
-        # Pattern 2: "translate [filename] from [source] to [target]"
-        pattern2 = r'translate\s+([^\s]+(?:\.[^\s]+)?)\s+from\s+([^\s]+)\s+to\s+([^\s]+)'
-        match2 = re.search(pattern2, query_lower)
-        if match2:
-            filename = match2.group(1)
-            source_lang = match2.group(2)
-            target_lang = match2.group(3)
+        match = _PAT_FROM_TO.search(user_query)
+        if match:
+            filename, source_lang, target_lang = match.groups()
             return filename, target_lang, source_lang
         
-        # Pattern 3: "[filename] to [language]"
-        pattern3 = r'([^\s]+(?:\.[^\s]+)?)\s+to\s+([^\s]+)'
-        match3 = re.search(pattern3, query_lower)
-        if match3:
-            filename = match3.group(1)
-            target_lang = match3.group(2)
+        match = _PAT_TRANSLATE_TO.search(user_query) or _PAT_TO.search(user_query)
+        if match:
+            filename, target_lang = match.groups()
             return filename, target_lang, "auto"
         
         return None
@@ -195,14 +206,8 @@ class SimpleTranslationHelper:
     
     def _normalize_language_code(self, language: str) -> Optional[str]:
         """Convert language name or code to standard ISO code."""
-        lang_lower = language.lower().strip()
-        
-        # If it's already a valid language code (2-3 letters)
-        if len(lang_lower) in [2, 3] and lang_lower.isalpha():
-            return lang_lower
-        
-        # Look up in language names mapping
-        return self.language_codes.get(lang_lower)
+        # The mapping is immutable, so results are cached at module level
+        return _normalize_language_code(language)
     
     def _format_success(self, input_path: Path, output_path: Path, target_lang: str, result: str) -> str:
         """Format successful translation result."""
@@ -265,5 +270,10 @@ def translate_document(filename: str, target_language: str, source_language: str
     Returns:
         Translation result message
     """
-    helper = SimpleTranslationHelper()
-    return helper.translate_document(filename, target_language, source_language)
\ No newline at end of file
+    return _get_shared_helper().translate_document(filename, target_language, source_language)
+
+
+@lru_cache(maxsize=None)
+def _get_shared_helper() -> SimpleTranslationHelper:
+    """Helper reused by translate_document, created on first use."""
+    return SimpleTranslationHelper()
\ No newline at end of file
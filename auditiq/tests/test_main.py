@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Tests for the AuditIQ command line parser.
+"""
+
+import unittest
+from auditiq.main import _parse
+
+
+class TestParse(unittest.TestCase):
+    """Test cases for `python -m auditiq.main` argument parsing."""
+    
+    def test_bare_query_runs(self):
+        """Test that a query without a command is run."""
+        args = _parse(["what", "is", "materiality?"])
+        self.assertEqual(args.cmd, "run")
+        self.assertEqual(args.user_query, "what is materiality?")
+    
+    def test_query_starting_with_command_name_runs(self):
+        """Test that a query whose first word is a command name, but doesn't fit it, is run."""
+        for argv in (["test", "our", "SOX", "controls"], ["replay", "the", "last", "audit"], ["train", "staff"]):
+            args = _parse(argv)
+            self.assertEqual(args.cmd, "run")
+            self.assertEqual(args.user_query, " ".join(argv))
+    
+    def test_explicit_commands(self):
+        """Test that arguments fitting a command go to that command."""
+        args = _parse(["test", "3", "gpt-4o"])
+        self.assertEqual((args.cmd, args.n_iterations, args.eval_llm), ("test", 3, "gpt-4o"))
+        args = _parse(["research", "latest", "trends"])
+        self.assertEqual((args.cmd, args.user_query), ("research", "latest trends"))
+        self.assertEqual(_parse(["replay", "task-1"]).task_id, "task-1")
+    
+    def test_no_arguments_runs(self):
+        """Test that no arguments means an interactive run."""
+        args = _parse([])
+        self.assertEqual((args.cmd, args.user_query), ("run", ""))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,128 +6,113 @@ Tests both ECHO and AUDIT RAG functionality
 
 import os
 import sys
-from dotenv import load_dotenv
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from _rag_test_helpers import BAR50, ENV_FILE, KEY_MASK, configure_logging, get_tool, load_env, log
+
+# Banner rules, built once
+_BAR60 = "=" * 60
+_BAR30 = "=" * 30
+
+# Azure Search (endpoint, key), read once by setup_environment
+_CREDS = (None, None)
+
+# Tools under test: (label, what it covers, package, class name, test query)
+_TOOLS = [
+    ("ECHO", "GT Guidelines", "audit_iq_echo_rag", "AuditIqEchoRag", "GT travel policy"),
+    ("AUDIT", "Audit Methodology", "audit_iq_audit_rag", "AuditIqAuditRag", "internal controls"),
+]
 
 def setup_environment():
-    """Setup environment and validate credentials."""
-    print("🔧 Setting up test environment")
-    print("=" * 50)
+    """Setup environment and validate credentials, keeping them for the tools."""
+    global _CREDS
+    log.info("🔧 Setting up test environment")
+    log.info(BAR50)
     
     # Load environment variables from audit rag .env file
-    env_file = '/Users/ferdinanda/Desktop/AuditIQ/audit_iq_audit_rag/.env'
-    load_dotenv(env_file)
+    env_file = ENV_FILE
+    load_env(env_file)
     
     # Check environment variables
     endpoint = os.getenv("AzureSearchEndpoint")
     key = os.getenv("AzureSearchAdminKey")
     
-    print(f"Environment file: {env_file}")
-    print(f"Azure Search Endpoint: {endpoint}")
-    print(f"Azure Search Key: {'*' * 20 if key else 'NOT SET'}")
-    print()
+    log.info(f"Environment file: {env_file}")
+    log.info(f"Azure Search Endpoint: {endpoint}")
+    log.info(f"Azure Search Key: {KEY_MASK if key else 'NOT SET'}")
+    log.info("")
     
     if not endpoint or not key:
-        print("❌ Azure Search credentials not configured!")
-        print("Please check your .env file has:")
-        print("  - AzureSearchEndpoint=https://your-search-service.search.windows.net")
-        print("  - AzureSearchAdminKey=your_admin_key")
+        log.error("❌ Azure Search credentials not configured!")
+        log.error("Please check your .env file has:")
+        log.error("  - AzureSearchEndpoint=https://your-search-service.search.windows.net")
+        log.error("  - AzureSearchAdminKey=your_admin_key")
         return False
     
+    _CREDS = (endpoint, key)
     return True
 
-def test_echo_tool():
-    """Test ECHO RAG tool for GT Guidelines."""
-    print("🔍 Testing ECHO RAG Tool (GT Guidelines)")
-    print("=" * 50)
+def run_tool(spec):
+    """
+    Run one search with a _TOOLS entry.
+    Returns (success, report), where report is a list of (log level, message) lines
+    so that tools running in parallel do not interleave their output.
+    """
+    label, description, package, class_name, test_query = spec
+    report = [(logging.INFO, f"🔍 Testing {label} RAG Tool ({description})"), (logging.INFO, BAR50)]
     
     try:
-        # Add echo rag tool to path and import
-        sys.path.insert(0, '/Users/ferdinanda/Desktop/AuditIQ/audit_iq_echo_rag/src')
-        from audit_iq_echo_rag import AuditIqEchoRag
-        
-        echo_tool = AuditIqEchoRag()
-        print("✅ ECHO RAG tool imported successfully")
+        tool = get_tool(package, class_name, *_CREDS)
+        report.append((logging.INFO, f"✅ {label} RAG tool imported successfully"))
         
         # Test a simple query
-        test_query = "GT travel policy"
-        print(f"📋 Testing query: '{test_query}'")
+        report.append((logging.INFO, f"📋 Testing query: '{test_query}'"))
         
-        result = echo_tool._run(query=test_query, top=1)
+        statuses = sys.modules[package]
+        status, result = tool.run_with_status(query=test_query, top=1)
         
-        if "Error:" in result:
-            print(f"❌ ECHO Tool Error: {result}")
-            return False
-        elif "No results found" in result:
-            print(f"⚠️  ECHO Tool: No results found (this might be expected)")
-            print(f"Result: {result}")
-            return True  # No results is still a successful connection
+        if status in (statuses.STATUS_ERROR, statuses.STATUS_UNREACHABLE):
+            report.append((logging.ERROR, f"❌ {label} Tool Error: {result}"))
+            return False, report
+        elif status == statuses.STATUS_EMPTY:
+            report.append((logging.WARNING, f"⚠️  {label} Tool: No results found (this might be expected)"))
+            report.append((logging.INFO, f"Result: {result}"))
+            return True, report  # No results is still a successful connection
         else:
-            print("✅ ECHO Tool: Search successful!")
-            print(f"Result preview: {result[:150]}...")
-            return True
+            report.append((logging.INFO, f"✅ {label} Tool: Search successful!"))
+            report.append((logging.INFO, f"Result preview: {result[:150]}..."))
+            return True, report
             
     except Exception as e:
-        print(f"❌ ECHO Tool Exception: {str(e)}")
-        return False
-
-def test_audit_tool():
-    """Test AUDIT RAG tool for audit methodology."""
-    print("🔍 Testing AUDIT RAG Tool (Audit Methodology)")
-    print("=" * 50)
-    
-    try:
-        # Add audit rag tool to path and import
-        sys.path.insert(0, '/Users/ferdinanda/Desktop/AuditIQ/audit_iq_audit_rag/src')
-        from audit_iq_audit_rag import AuditIqAuditRag
-        
-        audit_tool = AuditIqAuditRag()
-        print("✅ AUDIT RAG tool imported successfully")
-        
-        # Test a simple query
-        test_query = "internal controls"
-        print(f"📋 Testing query: '{test_query}'")
-        
-        result = audit_tool._run(query=test_query, top=1)
-        
-        if "Error:" in result:
-            print(f"❌ AUDIT Tool Error: {result}")
-            return False
-        elif "No results found" in result:
-            print(f"⚠️  AUDIT Tool: No results found (this might be expected)")
-            print(f"Result: {result}")
-            return True  # No results is still a successful connection
-        else:
-            print("✅ AUDIT Tool: Search successful!")
-            print(f"Result preview: {result[:150]}...")
-            return True
-            
-    except Exception as e:
-        print(f"❌ AUDIT Tool Exception: {str(e)}")
-        return False
+        report.append((logging.ERROR, f"❌ {label} Tool Exception: {str(e)}"))
+        return False, report
 
 def main():
     """Main test function."""
-    print("🚀 AuditIQ RAG Tools - Local Testing Suite")
-    print("=" * 60)
-    print()
+    log.info("🚀 AuditIQ RAG Tools - Local Testing Suite")
+    log.info(_BAR60)
+    log.info("")
     
     # Setup environment
     if not setup_environment():
         return False
     
-    print()
+    log.info("")
     
-    # Test ECHO tool
-    echo_success = test_echo_tool()
-    print()
+    # Test both tools at once; their Azure round-trips overlap
+    with ThreadPoolExecutor(max_workers=len(_TOOLS)) as executor:
+        outcomes = list(executor.map(run_tool, _TOOLS))
     
-    # Test AUDIT tool  
-    audit_success = test_audit_tool()
-    print()
+    for _, report in outcomes:
+        for level, message in report:
+            log.log(level, message)
+        log.info("")
+    
+    echo_success, audit_success = (success for success, _ in outcomes)
     
     # Summary
     print("📊 Test Results Summary")
-    print("=" * 30)
+    print(_BAR30)
     print(f"ECHO RAG Tool:  {'✅ PASSED' if echo_success else '❌ FAILED'}")
     print(f"AUDIT RAG Tool: {'✅ PASSED' if audit_success else '❌ FAILED'}")
     print()
@@ -140,5 +125,6 @@ def main():
         return False
 
 if __name__ == "__main__":
+    configure_logging()
     success = main()
     sys.exit(0 if success else 1)
\ No newline at end of file